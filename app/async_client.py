@@ -1,18 +1,52 @@
 # app/async_client.py
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
+from contextlib import aclosing
+import asyncio
 import os
+import stat
+import uuid
 import mimetypes
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from .schemas import (
     UploadFileRequest, 
+    UploadStreamRequest, 
     DownloadFileRequest, 
     DeleteFileRequest, 
+    DeleteManyFilesRequest, 
     GetFileMetadataRequest, 
+    GetManyFilesMetadataRequest, 
+    ListFilesRequest, 
     PresignedPutURLRequest, 
     PresignedGetURLRequest
 )
 from .config import minio_config
-from .utils import get_async_client, setup_lifecycle, create_bucket_if_not_exists
+from .lowlevel import bucket_path, quote_key, delete_object, head_object, presigned_url, is_retryable_error
+from .utils import (
+    DELETE_OBJECTS_MAX_KEYS,
+    UPLOAD_PART_SIZE,
+    plan_metadata_lookup,
+    object_summary,
+    object_summary_from_head,
+    OBJECT_SUMMARY_FIELDS,
+    is_not_found_error,
+    build_extension_mime_map,
+    PresignedURLCache,
+    TRANSFER_CONFIG,
+    get_async_client,
+    setup_bucket,
+    bootstrap_storage
+)
+
+
+# Size of the chunks in which downloaded object bodies are read and written to disk.
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Maximum number of parts of a streamed multipart upload that are uploaded (and buffered) at once.
+MAX_CONCURRENT_PARTS = 4
 
 
 class ObjectStorageClient:
@@ -23,8 +57,9 @@ class ObjectStorageClient:
     The client is designed to be instantiated per bucket rather than subclassed because all buckets
     follow the same operational semantics without bucket-specific rules that would justify inheritance.
 
-    Each public method creates a fresh S3 client on-demand. Input data is assumed to be pre-validated
-    by Pydantic schemas before reaching these methods.
+    Each public method obtains an S3 client via `get_async_client()`, which reuses the shared client
+    once `open_async_client()` has been awaited on startup and falls back to a short-lived client
+    otherwise. Input data is assumed to be pre-validated by Pydantic schemas before reaching these methods.
 
     Attributes
     ----------
@@ -32,18 +67,34 @@ class ObjectStorageClient:
         The name of the bucket this client instance operates on.
     max_file_size : int
         Maximum allowed file size in bytes.
-    allowed_mime_types : set[str]
-        Set of allowed MIME types.
+    allowed_mime_types : frozenset[str] | None
+        Set of allowed MIME types, or None to allow any type.
     expiration_days : int | None
         Number of days after which objects are automatically deleted, or None for no expiration.
+    transfer_config : TransferConfig
+        Settings of the managed multipart uploads of this bucket (downloads stream `get_object`).
     """
 
+    # Instances hold a fixed set of attributes, so skip the per-instance `__dict__`
+    __slots__ = (
+        'bucket_name',
+        'max_file_size',
+        'allowed_mime_types',
+        'expiration_days',
+        'transfer_config',
+        '_mime_type_error_suffix',
+        '_extension_mime_map',
+        '_presigned_url_cache',
+        '_object_path_prefix',
+    )
+
     def __init__(
         self,
         bucket_name: str,
         max_file_size: int,
         allowed_mime_types: list[str],
         expiration_days: int | None = None,
+        transfer_config: TransferConfig | None = None,
     ):
         """
         Initialize the target bucket and optional constraints.
@@ -58,16 +109,30 @@ class ObjectStorageClient:
         max_file_size : int
             Maximum file size in bytes.
         allowed_mime_types : list[str]
-            list of allowed MIME types. Internally converted to a set for performance.
+            list of allowed MIME types. Internally converted to a frozenset for performance.
         expiration_days : int | None, optional
             Number of days after which objects in the bucket are automatically deleted.
             If None, no expiration policy is set. Default is None.
+        transfer_config : TransferConfig | None, optional
+            Settings of managed uploads, e.g. smaller parts for a bucket of small images.
+            If None, the shared `TRANSFER_CONFIG` is used. Default is None.
         """
         
         self.bucket_name = bucket_name
         self.max_file_size = max_file_size
-        self.allowed_mime_types = set(allowed_mime_types) if allowed_mime_types is not None else None
+        self.allowed_mime_types = frozenset(allowed_mime_types) if allowed_mime_types is not None else None
+        # Tail of the rejection message, built once instead of sorting the allowed types per rejection
+        self._mime_type_error_suffix = (
+            f"Allowed types: {sorted(self.allowed_mime_types)}" if allowed_mime_types is not None else ""
+        )
         self.expiration_days = expiration_days
+        self.transfer_config = transfer_config if transfer_config is not None else TRANSFER_CONFIG
+        # Extension -> MIME type lookup for the allowed types, consulted before `mimetypes`
+        self._extension_mime_map = build_extension_mime_map(self.allowed_mime_types)
+        # Recently generated presigned URLs, keyed by their (frozen, hashable) request
+        self._presigned_url_cache = PresignedURLCache()
+        # Encoded `/<bucket>/` path prefix for low-level requests, computed once per bucket
+        self._object_path_prefix = bucket_path(bucket_name)
 
         # Synchronous bucket setup in __init__ is intentional:
         # 1. __init__ cannot be async, so these must be synchronous calls
@@ -75,32 +140,69 @@ class ObjectStorageClient:
         #    that must complete before any async operations begin. These administrative
         #    tasks configure the bucket itself and should never run concurrently with
         #    file operations - setup must finish first, then async usage can proceed.
-        create_bucket_if_not_exists(bucket_name=self.bucket_name)
+        setup_bucket(bucket_name=self.bucket_name, expiration_days=self.expiration_days)
+
+
+    async def _validate_parent_directory(self, file_path: str) -> None:
+        """
+        Validate that the parent directory of the given path exists and is a directory.
+
+        Parameters
+        ----------
+        file_path : str
+            Path whose parent directory to validate.
+
+        Raises
+        ------
+        ValueError
+            If the parent path does not exist or is not a directory.
+        """
 
-        if self.expiration_days is not None:
-            setup_lifecycle(bucket_name=self.bucket_name, expiration_days=self.expiration_days)
+        parent = os.path.dirname(file_path) or "."
+        try:
+            # `stat` is a blocking syscall, so keep it off the event loop
+            mode = (await asyncio.to_thread(os.stat, parent)).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"Parent path does not exist: {parent}") from None
+        if not stat.S_ISDIR(mode):
+            raise ValueError(f"Parent path is not a directory: {parent}")
 
 
-    async def _validate_file_size(self, file_path: str) -> None:
+    async def _validate_file(self, file_path: str) -> int:
         """
-        Validate that the file size does not exceed the configured maximum.
+        Validate that the given path points to an existing regular file not exceeding the configured
+        maximum size.
+
+        Both checks are answered by a single `stat` call.
 
         Parameters
         ----------
         file_path : str
             Path to the file to validate.
 
+        Returns
+        -------
+        int
+            The size of the file in bytes.
+
         Raises
         ------
         ValueError
-            If file size exceeds max_file_size.
+            If the file does not exist, is not a regular file or its size exceeds max_file_size.
         """
 
-        file_size = os.path.getsize(file_path)
-        if file_size > self.max_file_size:
+        try:
+            # `stat` is a blocking syscall (slow on network filesystems), so keep it off the event loop
+            file_stat = await asyncio.to_thread(os.stat, file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"File not found: {file_path}") from None
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise ValueError(f"File not found: {file_path}")
+        if file_stat.st_size > self.max_file_size:
             raise ValueError(
-                f"File size {file_size} bytes exceeds maximum allowed size of {self.max_file_size} bytes"
+                f"File size {file_stat.st_size} bytes exceeds maximum allowed size of {self.max_file_size} bytes"
             )
+        return file_stat.st_size
 
 
     async def _validate_mime_type(self, mime_type: str) -> None:
@@ -121,14 +223,158 @@ class ObjectStorageClient:
         if self.allowed_mime_types is not None:
             if mime_type not in self.allowed_mime_types:
                 raise ValueError(
-                    f"MIME type '{mime_type}' is not allowed. Allowed types: {sorted(self.allowed_mime_types)}"
+                    f"MIME type '{mime_type}' is not allowed. {self._mime_type_error_suffix}"
                 )
 
 
+    def _guess_mime_type(self, file_path: str) -> str | None:
+        """
+        Guess the MIME type of a file from its extension.
+
+        Extensions of the allowed MIME types are resolved with a dictionary lookup; only other
+        extensions go through `mimetypes.guess_type`.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        str | None
+            The guessed MIME type, or None if it cannot be determined.
+        """
+
+        # The extension's case is kept: `guess_type` tries it case-sensitively first
+        mime_type = self._extension_mime_map.get(os.path.splitext(file_path)[1])
+        if mime_type is None:
+            mime_type, _ = mimetypes.guess_type(file_path)
+        return mime_type
+
+
+    async def _head_object_summary(self, storage_key: str) -> tuple[str, dict[str, Any] | None]:
+        """
+        Inspect a single object with a low-level HEAD request.
+
+        Parameters
+        ----------
+        storage_key : str
+            Key of the object to inspect.
+
+        Returns
+        -------
+        tuple[str, dict[str, Any] | None]
+            The key and its object summary, or None if the object does not exist.
+        """
+
+        try:
+            response = await head_object(self._object_path_prefix + quote_key(storage_key))
+        except ClientError as e:
+            if is_not_found_error(e):
+                return storage_key, None
+            raise
+        return storage_key, object_summary_from_head(storage_key, response)
+
+
+    async def _list_object_summaries(
+        self,
+        client: Any,
+        prefix: str,
+        storage_keys: list[str]
+    ) -> list[tuple[str, dict[str, Any] | None]]:
+        """
+        Inspect a group of objects sharing a prefix with a single LIST request.
+
+        Keys missing from the listing are reported as non-existent, unless the listing was truncated,
+        in which case they are inspected individually with HEAD requests.
+
+        Parameters
+        ----------
+        client : Any
+            The S3-compatible client to issue the requests with.
+        prefix : str
+            Prefix common to all keys in the group.
+        storage_keys : list[str]
+            Keys of the objects to inspect.
+
+        Returns
+        -------
+        list[tuple[str, dict[str, Any] | None]]
+            Pairs of key and object summary (None if the object does not exist).
+        """
+
+        response = await client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix, MaxKeys=1000)
+        listed = {obj['Key']: obj for obj in response.get('Contents', [])}
+        truncated = response.get('IsTruncated', False)
+
+        results = []
+        unresolved = []
+        for key in storage_keys:
+            if key in listed:
+                results.append((key, object_summary(listed[key])))
+            elif truncated:
+                unresolved.append(key)
+            else:
+                results.append((key, None))
+
+        results.extend(await asyncio.gather(*(self._head_object_summary(key) for key in unresolved)))
+        return results
+
+
+    async def _upload_part(
+        self,
+        client: Any,
+        storage_key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+        slots: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """
+        Upload one part of a multipart upload and release its concurrency slot.
+
+        Parameters
+        ----------
+        client : Any
+            The S3-compatible client to issue the request with.
+        storage_key : str
+            Key of the object being uploaded.
+        upload_id : str
+            ID of the multipart upload.
+        part_number : int
+            1-based number of the part.
+        data : bytes
+            Content of the part.
+        slots : asyncio.Semaphore
+            Semaphore bounding the number of parts in flight, acquired by the caller.
+
+        Returns
+        -------
+        dict[str, Any]
+            The part entry (PartNumber and ETag) expected by `CompleteMultipartUpload`.
+        """
+
+        try:
+            response = await client.upload_part(
+                Body=data,
+                Bucket=self.bucket_name,
+                Key=storage_key,
+                UploadId=upload_id,
+                PartNumber=part_number
+            )
+        finally:
+            slots.release()
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+
     async def upload(self, request: UploadFileRequest) -> None:
         """
         Upload a local file to the bucket under the specified storage key.
 
+        Files up to `multipart_threshold` bytes are read in a worker thread and sent with a single
+        `PutObject` request, avoiding the managed transfer machinery of `upload_file`, which only
+        pays off for multipart uploads. Larger files are uploaded with `upload_file`.
+
         Parameters
         ----------
         request : UploadFileRequest
@@ -138,26 +384,139 @@ class ObjectStorageClient:
         Raises
         ------
         ValueError
-            If file validation fails (size or MIME type constraints).
+            If file validation fails (missing file, size or MIME type constraints).
         ClientError
             If the upload operation fails.
         """
 
-        await self._validate_file_size(request.file_path)
-        mime_type, _ = mimetypes.guess_type(request.file_path)
+        file_size = await self._validate_file(request.file_path)
+        mime_type = self._guess_mime_type(request.file_path)
         await self._validate_mime_type(mime_type)
 
+        if file_size <= self.transfer_config.multipart_threshold:
+            body = await asyncio.to_thread(Path(request.file_path).read_bytes)
+            async with get_async_client() as client:
+                await client.put_object(
+                    Body=body,
+                    Bucket=self.bucket_name,
+                    Key=request.storage_key,
+                    ContentLength=len(body)
+                )
+            return
+
         async with get_async_client() as client:
             await client.upload_file(
                 Filename=request.file_path,
                 Bucket=self.bucket_name,
-                Key=request.storage_key
+                Key=request.storage_key,
+                Config=self.transfer_config
             )
 
+
+    async def upload_stream(self, request: UploadStreamRequest, body: AsyncIterable[bytes]) -> None:
+        """
+        Upload a stream of bytes to the bucket under the specified storage key.
+
+        The data is never written to a local file. Chunks are buffered until a full part
+        (`UPLOAD_PART_SIZE`) is available: a stream that ends before that is sent with a single
+        `PutObject` request, a longer one is sent as a multipart upload. Parts are uploaded
+        concurrently while the stream is still being read, with at most `MAX_CONCURRENT_PARTS`
+        parts in flight (and held in memory) at once. If anything fails, the multipart upload
+        is aborted so no orphaned parts are left behind.
+
+        Parameters
+        ----------
+        request : UploadStreamRequest
+            Validated request containing storage_key and content_type.
+        body : AsyncIterable[bytes]
+            Chunks of the content to upload, in order.
+
+        Raises
+        ------
+        ValueError
+            If content_type is not allowed or the streamed data exceeds max_file_size.
+        ClientError
+            If the upload operation fails.
+        """
+
+        await self._validate_mime_type(request.content_type)
+
+        buffer = bytearray()
+        total_size = 0
+        upload_id = None
+        part_tasks = []
+        slots = asyncio.Semaphore(MAX_CONCURRENT_PARTS)
+
+        async with get_async_client() as client:
+            try:
+                async for chunk in body:
+                    total_size += len(chunk)
+                    if total_size > self.max_file_size:
+                        raise ValueError(
+                            f"Streamed data exceeds maximum allowed size of {self.max_file_size} bytes"
+                        )
+                    buffer += chunk
+
+                    while len(buffer) >= UPLOAD_PART_SIZE:
+                        if upload_id is None:
+                            response = await client.create_multipart_upload(
+                                Bucket=self.bucket_name,
+                                Key=request.storage_key,
+                                ContentType=request.content_type
+                            )
+                            upload_id = response['UploadId']
+
+                        await slots.acquire()
+                        part_tasks.append(asyncio.create_task(self._upload_part(
+                            client, request.storage_key, upload_id, len(part_tasks) + 1,
+                            bytes(buffer[:UPLOAD_PART_SIZE]), slots
+                        )))
+                        del buffer[:UPLOAD_PART_SIZE]
+
+                if upload_id is None:
+                    await client.put_object(
+                        Body=bytes(buffer),
+                        Bucket=self.bucket_name,
+                        Key=request.storage_key,
+                        ContentType=request.content_type
+                    )
+                    return
+
+                if buffer:
+                    await slots.acquire()
+                    part_tasks.append(asyncio.create_task(self._upload_part(
+                        client, request.storage_key, upload_id, len(part_tasks) + 1, bytes(buffer), slots
+                    )))
+
+                parts = await asyncio.gather(*part_tasks)
+                await client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=request.storage_key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+            except BaseException:
+                for task in part_tasks:
+                    task.cancel()
+                await asyncio.gather(*part_tasks, return_exceptions=True)
+                if upload_id is not None:
+                    await client.abort_multipart_upload(
+                        Bucket=self.bucket_name,
+                        Key=request.storage_key,
+                        UploadId=upload_id
+                    )
+                raise
+
+
     async def download(self, request: DownloadFileRequest) -> None:
         """
         Download an object from the bucket and save it to the local filesystem.
 
+        The object body is streamed with a single `GetObject` request and written chunk by chunk
+        from a worker thread, so memory usage is bounded by the chunk size. Data is written to
+        a temporary file next to the target path, which replaces the target only once the
+        download completes.
+
         Parameters
         ----------
         request : DownloadFileRequest
@@ -166,22 +525,45 @@ class ObjectStorageClient:
 
         Raises
         ------
+        ValueError
+            If the parent directory of file_path does not exist.
         ClientError
             If the object does not exist (NoSuchKey) or the download operation fails.
         """
         
+        await self._validate_parent_directory(request.file_path)
+
+        temp_path = f"{request.file_path}.{uuid.uuid4().hex}.part"
+
         async with get_async_client() as client:
-            await client.download_file(
-                Bucket=self.bucket_name,
-                Key=request.storage_key,
-                Filename=request.file_path
-            )
+            response = await client.get_object(Bucket=self.bucket_name, Key=request.storage_key)
+
+            body = response['Body']
+            file = None
+            try:
+                # `StreamingBody.__aenter__` returns the underlying aiohttp response, so the chunks
+                # are read from `body` itself; leaving the block releases the connection
+                async with body:
+                    file = await asyncio.to_thread(open, temp_path, 'wb')
+                    async for chunk in body.iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(file.write, chunk)
+            except BaseException:
+                if file is not None:
+                    await asyncio.to_thread(file.close)
+                    await asyncio.to_thread(os.remove, temp_path)
+                raise
+
+        await asyncio.to_thread(file.close)
+        await asyncio.to_thread(os.replace, temp_path, request.file_path)
 
 
     async def delete(self, request: DeleteFileRequest) -> None:
         """
         Delete an object from the bucket by its storage key.
 
+        The request is signed and sent directly over the shared aiohttp session (see `lowlevel.py`),
+        bypassing botocore's per-call request pipeline.
+
         The operation is idempotent: deleting a non-existent object does not raise an error
         (consistent with S3 semantics). The client does not validate object existence beforehand.
 
@@ -196,11 +578,52 @@ class ObjectStorageClient:
             If the delete operation fails for reasons other than the object not existing.
         """
         
+        await delete_object(self._object_path_prefix + quote_key(request.storage_key))
+
+
+    async def delete_many(self, request: DeleteManyFilesRequest) -> list[dict[str, Any]]:
+        """
+        Delete multiple objects from the bucket using batched `DeleteObjects` requests.
+
+        Keys are sent in chunks of up to 1000 (the S3 per-request limit), so deleting N objects
+        costs ceil(N / 1000) round trips instead of N. Chunks are sent concurrently.
+        As with `delete`, deleting non-existent objects is not an error.
+
+        Parameters
+        ----------
+        request : DeleteManyFilesRequest
+            Validated request containing storage_keys (keys of the objects to delete).
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Per-object errors reported by the storage, each containing Key, Code and Message.
+            An empty list means every object was deleted.
+
+        Raises
+        ------
+        ClientError
+            If a batch delete request fails as a whole.
+        """
+
+        keys = request.storage_keys
+        chunks = [
+            keys[i:i + DELETE_OBJECTS_MAX_KEYS] for i in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS)
+        ]
+
         async with get_async_client() as client:
-            await client.delete_object(
-                Bucket=self.bucket_name,
-                Key=request.storage_key
-            )
+            responses = await asyncio.gather(*(
+                client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in chunk],
+                        'Quiet': True
+                    }
+                )
+                for chunk in chunks
+            ))
+
+        return [error for response in responses for error in response.get('Errors', [])]
 
 
     async def get_metadata(self, request: GetFileMetadataRequest) -> dict[str, Any]:
@@ -231,10 +654,169 @@ class ObjectStorageClient:
             return await client.head_object(Bucket=self.bucket_name, Key=request.storage_key)
 
 
+    async def get_metadata_many(self, request: GetManyFilesMetadataRequest) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieve summary metadata about multiple objects in the bucket.
+
+        Small lookups issue one HEAD request per key. Larger lookups group keys by a shared
+        prefix and resolve each group with a single `ListObjectsV2` request, falling back to HEAD
+        only for keys a truncated listing did not cover. This turns N round trips into roughly
+        one per distinct prefix. All requests are sent concurrently.
+
+        Parameters
+        ----------
+        request : GetManyFilesMetadataRequest
+            Validated request containing storage_keys (keys of the objects to inspect).
+
+        Returns
+        -------
+        dict[str, dict[str, Any] | None]
+            Mapping of each requested key to its summary (Key, Size, ETag, LastModified),
+            or None if the object does not exist. Keys appear in request order.
+
+        Raises
+        ------
+        ClientError
+            If a HEAD or LIST request fails for reasons other than a missing object.
+        """
+
+        head_keys, list_groups = plan_metadata_lookup(request.storage_keys)
+
+        async with get_async_client() as client:
+            head_results, list_results = await asyncio.gather(
+                asyncio.gather(*(self._head_object_summary(key) for key in head_keys)),
+                asyncio.gather(*(
+                    self._list_object_summaries(client, prefix, keys) for prefix, keys in list_groups.items()
+                ))
+            )
+
+        summaries = dict(head_results)
+        for group_results in list_results:
+            summaries.update(group_results)
+        return {key: summaries[key] for key in request.storage_keys}
+
+
+    async def iter_all(self, prefix: str = "", page_size: int = 1000) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all objects in the bucket, fetching them page by page.
+
+        Pages are requested lazily with the `ListObjectsV2` paginator, so memory usage is bounded
+        by the page size and iteration can stop early without listing the rest of the bucket.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Only objects whose keys start with this prefix are listed. Default is '' (all objects).
+        page_size : int, optional
+            Number of objects requested per page, capped at 1000 (the S3 limit). Default is 1000.
+
+        Yields
+        ------
+        dict[str, Any]
+            Raw `ListObjectsV2` entries, including Key, Size, ETag and LastModified.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        async with get_async_client() as client:
+            paginator = client.get_paginator('list_objects_v2')
+            async for page in paginator.paginate(
+                Bucket=self.bucket_name,
+                Prefix=prefix,
+                PaginationConfig={'PageSize': min(page_size, 1000)}
+            ):
+                for obj in page.get('Contents', []):
+                    yield obj
+
+
+    async def get_all(self, request: ListFilesRequest) -> list[dict[str, Any]]:
+        """
+        List objects in the bucket, following pagination up to the requested number of objects.
+
+        Parameters
+        ----------
+        request : ListFilesRequest
+            Validated request containing prefix and max_keys.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Raw `ListObjectsV2` entries, including Key, Size, ETag and LastModified,
+            in lexicographical key order.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        objects = []
+        async with aclosing(
+            self.iter_all(prefix=request.prefix, page_size=min(request.max_keys, 1000))
+        ) as iterator:
+            async for obj in iterator:
+                objects.append(obj)
+                if len(objects) >= request.max_keys:
+                    break
+        return objects
+
+
+    async def get_all_columnar(
+        self,
+        request: ListFilesRequest,
+        fields: tuple[str, ...] = OBJECT_SUMMARY_FIELDS
+    ) -> dict[str, list[Any]]:
+        """
+        List objects in the bucket like `get_all`, but return their attributes column by column.
+
+        Instead of one dict per object, a single list per requested attribute is built, which takes
+        far less memory for large listings and suits aggregations over a single attribute
+        (e.g., `sum(columns['Size'])`). Requesting only the needed fields skips the others entirely.
+
+        Parameters
+        ----------
+        request : ListFilesRequest
+            Validated request containing prefix and max_keys.
+        fields : tuple[str, ...], optional
+            `ListObjectsV2` entry attributes to collect. Default is Key, Size, ETag and LastModified.
+
+        Returns
+        -------
+        dict[str, list[Any]]
+            Mapping of each requested attribute to its values, aligned by object
+            and in lexicographical key order.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        columns = {field: [] for field in fields}
+        appenders = [(field, columns[field].append) for field in fields]
+
+        count = 0
+        async with aclosing(
+            self.iter_all(prefix=request.prefix, page_size=min(request.max_keys, 1000))
+        ) as iterator:
+            async for obj in iterator:
+                for field, append in appenders:
+                    append(obj[field])
+                count += 1
+                if count >= request.max_keys:
+                    break
+        return columns
+
+
     async def generate_presigned_put_url(self, request: PresignedPutURLRequest) -> str:
         """
         Generate a presigned URL for uploading an object directly to the storage bucket.
 
+        URLs are reused for repeated identical requests for a short time (see `PresignedURLCache`).
+
         This enables client-side uploads without routing data through the application server,
         reducing bandwidth costs and latency. The client must include the correct Content-Type
         header when making the PUT request.
@@ -258,8 +840,12 @@ class ObjectStorageClient:
         
         await self._validate_mime_type(request.content_type)
 
+        url = self._presigned_url_cache.get(request)
+        if url is not None:
+            return url
+
         async with get_async_client() as client:
-            return await client.generate_presigned_url(
+            url = await client.generate_presigned_url(
                 'put_object',
                 Params={
                     'Bucket': self.bucket_name,
@@ -268,34 +854,91 @@ class ObjectStorageClient:
                 },
                 ExpiresIn=request.expires
             )
+        self._presigned_url_cache.put(request, url, request.expires)
+        return url
+
+
+    async def generate_presigned_put_urls(self, requests: list[PresignedPutURLRequest]) -> list[str]:
+        """
+        Generate presigned upload URLs for many objects at once.
+
+        The URLs are signed directly with the cached SigV4 signing key and a single timestamp,
+        instead of going through botocore's request pipeline once per URL. They are equivalent
+        to those of `generate_presigned_put_url`: the client must send the same Content-Type.
+
+        Parameters
+        ----------
+        requests : list[PresignedPutURLRequest]
+            Validated requests, each containing storage_key, expires, and content_type.
+
+        Returns
+        -------
+        list[str]
+            Temporary upload URLs, in the order of `requests`.
+
+        Raises
+        ------
+        ValueError
+            If the `content_type` of any request is not allowed according to `allowed_mime_types`.
+            No URL is generated in that case.
+        """
+
+        for request in requests:
+            await self._validate_mime_type(request.content_type)
+
+        now = datetime.now(timezone.utc)
+        return [
+            presigned_url(
+                'PUT',
+                self._object_path_prefix + quote_key(request.storage_key),
+                request.expires,
+                headers={'content-type': request.content_type},
+                now=now
+            )
+            for request in requests
+        ]
+
 
     async def generate_presigned_get_url(self, request: PresignedGetURLRequest) -> str:
         """
         Generate a presigned URL for downloading an object from the storage bucket.
 
+        URLs are reused for repeated identical requests for a short time (see `PresignedURLCache`).
+
         This enables client-side downloads without routing data through the application server,
         reducing bandwidth costs and improving performance for large files.
 
+        Signing is a local computation. The object is only checked for existence (with a HEAD
+        request) when `verify_exists` is set; otherwise a URL for a missing object fails on download.
+
         Parameters
         ----------
         request : PresignedGetURLRequest
-            Validated request containing storage_key and expires.
+            Validated request containing storage_key, expires and verify_exists.
 
         Returns
         -------
         str
             A temporary URL that allows direct download from the object storage.
             The URL is only valid for the specified expiration period.
+
+        Raises
+        ------
+        ClientError
+            If verify_exists is set and the object does not exist (404) or the check fails.
         """
 
-        try:
-            metadata_request = GetFileMetadataRequest(storage_key=request.storage_key)
+        if request.verify_exists:
+            # The storage key has already been validated by `PresignedGetURLRequest`
+            metadata_request = GetFileMetadataRequest.model_construct(storage_key=request.storage_key)
             await self.get_metadata(metadata_request)
-        except ClientError as e:
-            raise
+
+        url = self._presigned_url_cache.get(request)
+        if url is not None:
+            return url
 
         async with get_async_client() as client:
-            return await client.generate_presigned_url(
+            url = await client.generate_presigned_url(
                 'get_object',
                 Params={
                     'Bucket': self.bucket_name,
@@ -303,6 +946,172 @@ class ObjectStorageClient:
                 },
                 ExpiresIn=request.expires
             )
+        self._presigned_url_cache.put(request, url, request.expires)
+        return url
+
+
+class UploadPipeline:
+    """
+    Producer-consumer pipeline for uploading many files through an asynchronous storage client.
+
+    Submitted requests are queued and drained by a fixed pool of worker tasks, so uploads overlap:
+    while one upload waits on the network, the next ones are already being validated, read and signed,
+    instead of each upload starting only after the previous one has finished. Uploads that fail with
+    a transient error (throttling, 5xx, connection failure; see `is_retryable_error`) are retried with
+    exponential backoff (1s, 2s, 4s, ...), on top of the retries of the S3 client itself.
+
+    Must be used as an asynchronous context manager; leaving the block waits for all submitted
+    uploads to finish and stops the workers. If the block raises or is cancelled, uploads that
+    have not finished are cancelled instead, and so are their futures:
+        async with UploadPipeline(documents_storage_client) as pipeline:
+            futures = [pipeline.submit(request) for request in requests]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+    Attributes
+    ----------
+    storage_client : ObjectStorageClient
+        The client performing the uploads.
+    workers : int
+        Number of uploads running concurrently.
+    max_attempts : int
+        Maximum number of attempts per upload, including the first one.
+    """
+
+    def __init__(
+        self,
+        storage_client: ObjectStorageClient,
+        workers: int | None = None,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize the pipeline. Workers are started when entering the `async with` block.
+
+        Parameters
+        ----------
+        storage_client : ObjectStorageClient
+            The client performing the uploads.
+        workers : int | None, optional
+            Number of uploads running concurrently. If None, uses `max_pool_connections`
+            capped at 16. Default is None.
+        max_attempts : int, optional
+            Maximum number of attempts per upload, including the first one. Default is 3.
+        """
+
+        self.storage_client = storage_client
+        self.workers = workers if workers is not None else min(16, minio_config.max_pool_connections)
+        self.max_attempts = max_attempts
+        self._queue: asyncio.Queue | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+
+
+    async def __aenter__(self) -> "UploadPipeline":
+        """Start the worker tasks."""
+
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """
+        Wait for all submitted uploads to finish (unless the block raised), then stop the workers.
+
+        The workers are stopped even if waiting is cancelled. Futures of uploads that did not finish
+        are cancelled, so no caller awaits them forever.
+        """
+
+        try:
+            if exc_type is None:
+                await self._queue.join()
+        finally:
+            for task in self._worker_tasks:
+                task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+            self._worker_tasks = []
+
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+                self._queue.task_done()
+
+
+    def submit(self, request: UploadFileRequest) -> asyncio.Future:
+        """
+        Queue a file for upload.
+
+        Parameters
+        ----------
+        request : UploadFileRequest
+            Validated request containing storage_key and file_path.
+
+        Returns
+        -------
+        asyncio.Future
+            Resolves to None once the file is uploaded, or raises the error of the last attempt.
+
+        Raises
+        ------
+        RuntimeError
+            If the pipeline has not been entered with `async with`.
+        """
+
+        if not self._worker_tasks:
+            raise RuntimeError("UploadPipeline must be entered with 'async with' before submitting uploads")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((request, future))
+        return future
+
+
+    async def _upload_with_retry(self, request: UploadFileRequest) -> None:
+        """
+        Upload a file, retrying transient errors with exponential backoff.
+
+        Validation errors (ValueError) and permanent storage errors (e.g., AccessDenied) are not
+        retried, since another attempt would fail the same way.
+
+        Parameters
+        ----------
+        request : UploadFileRequest
+            Validated request containing storage_key and file_path.
+
+        Raises
+        ------
+        ValueError
+            If file validation fails.
+        ClientError
+            If the error is permanent or the last attempt fails.
+        """
+
+        for attempt in range(self.max_attempts):
+            try:
+                await self.storage_client.upload(request)
+                return
+            except Exception as e:
+                if not is_retryable_error(e) or attempt == self.max_attempts - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+
+    async def _worker(self) -> None:
+        """Drain the queue, uploading one file at a time and resolving its future."""
+
+        while True:
+            request, future = await self._queue.get()
+            try:
+                if not future.cancelled():
+                    await self._upload_with_retry(request)
+                    if not future.done():
+                        future.set_result(None)
+            except asyncio.CancelledError:
+                # The worker is being stopped mid-upload: release the caller, then stop
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
 
 
 # Initialize AsyncObjectStorageClient singletons for predefined buckets.
@@ -310,17 +1119,23 @@ class ObjectStorageClient:
 # via minio_config, and these bucket names remain constant for the application's lifetime,
 # it is safe, efficient, and semantically correct to instantiate dedicated AsyncObjectStorageClient
 # instances once at module level.
+#
+# Each instance sets up its bucket synchronously (see `__init__`), so both are constructed
+# concurrently by `bootstrap_storage()` and their setup round trips overlap.
 
-documents_storage_client = ObjectStorageClient(
-    bucket_name=minio_config.documents_bucket_name,
-    max_file_size=minio_config.documents_max_file_size,
-    allowed_mime_types=minio_config.documents_allowed_mime_types,
-    expiration_days=minio_config.documents_expiration_days
+documents_storage_client, images_storage_client = bootstrap_storage(
+    partial(
+        ObjectStorageClient,
+        bucket_name=minio_config.documents_bucket_name,
+        max_file_size=minio_config.documents_max_file_size,
+        allowed_mime_types=minio_config.documents_allowed_mime_types,
+        expiration_days=minio_config.documents_expiration_days
+    ),
+    partial(
+        ObjectStorageClient,
+        bucket_name=minio_config.images_bucket_name,
+        max_file_size=minio_config.images_max_file_size,
+        allowed_mime_types=minio_config.images_allowed_mime_types,
+        expiration_days=minio_config.images_expiration_days
+    ),
 )
-
-images_storage_client = ObjectStorageClient(
-    bucket_name=minio_config.images_bucket_name,
-    max_file_size=minio_config.images_max_file_size,
-    allowed_mime_types=minio_config.images_allowed_mime_types,
-    expiration_days=minio_config.images_expiration_days
-)
\ No newline at end of file
@@ -1,4 +1,5 @@
 # app/config.py
+from functools import cached_property
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +19,15 @@ class MinIOConfig(BaseSettings):
         MinIO root username (acts as AWS access key).
     root_password : str
         MinIO root password (acts as AWS secret key).
+    max_pool_connections : int
+        Maximum number of connections kept in the client's HTTP connection pool,
+        i.e. the upper bound on concurrent requests to MinIO. Must be in the range 1-1000.
+        Default is `64`.
+    tcp_keepalive : bool
+        Whether to enable TCP keep-alive on pooled connections. Default is `True`.
+    multipart_threshold : int
+        File size (in bytes) above which uploads switch from a single `PutObject` request
+        to a managed multipart transfer. Default is `8388608` (8 MiB).
     images_bucket_name : str
         Name of the MinIO bucket designated for storing image files.
     images_max_file_size : int
@@ -68,6 +78,13 @@ class MinIOConfig(BaseSettings):
     root_username: str
     root_password: str
 
+    # Connection pool settings
+    max_pool_connections: int = Field(64, ge=1, le=1000)
+    tcp_keepalive: bool = True
+
+    # Transfer settings
+    multipart_threshold: int = Field(8 * 1024 * 1024, gt=0)
+
     # Images bucket settings
     images_bucket_name: str
     images_max_file_size: int = Field(..., gt=0)
@@ -80,11 +97,13 @@ class MinIOConfig(BaseSettings):
     documents_allowed_mime_types: list[str] = Field(..., min_length=1)
     documents_expiration_days: int | None = Field(None, gt=0)
 
-    @property
+    @cached_property
     def connection_url(self) -> str:
         """
         Build MinIO connection URL from configuration settings.
 
+        The configuration is immutable, so the URL is built on first access and cached.
+
         Returns
         -------
         str
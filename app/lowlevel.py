@@ -0,0 +1,642 @@
+# app/lowlevel.py
+from typing import Any, AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urlsplit
+import asyncio
+import hashlib
+import hmac
+import random
+import xml.etree.ElementTree as ET
+import aiohttp
+from multidict import CIMultiDictProxy
+from yarl import URL
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+from .config import minio_config
+
+
+# SHA-256 digest of an empty request body, sent with every body-less request.
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+
+# Timeouts, in seconds, for establishing a connection and for each read from it.
+# Shared with the aiobotocore client configuration, so both request paths behave the same.
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 60
+
+# Maximum number of attempts per request, including the first one, for both request paths.
+MAX_ATTEMPTS = 3
+
+# Error codes of throttled or timed out requests, which are worth retrying.
+RETRYABLE_ERROR_CODES = frozenset({
+    'Throttling',
+    'ThrottlingException',
+    'SlowDown',
+    'RequestTimeout',
+    'RequestTimeoutException',
+})
+
+
+class SigV4Signer:
+    """
+    Minimal AWS Signature Version 4 signer for S3-compatible requests.
+
+    botocore signs every request through its full handler chain (endpoint resolution, serialization,
+    event hooks), which dominates the cost of tiny requests such as `DeleteObject`. This signer only
+    computes what SigV4 requires and caches the derived signing key, which depends solely on the
+    secret key, the date, the region and the service. The key is therefore derived once per day
+    instead of with four HMAC operations per request.
+
+    Attributes
+    ----------
+    access_key : str
+        Access key (MinIO root username).
+    region : str
+        Region included in the credential scope. MinIO ignores its value.
+    service : str
+        Service included in the credential scope.
+    """
+
+    def __init__(self, access_key: str, secret_key: str, region: str = "us-east-1", service: str = "s3"):
+        """
+        Initialize the signer with static credentials.
+
+        Parameters
+        ----------
+        access_key : str
+            Access key (MinIO root username).
+        secret_key : str
+            Secret key (MinIO root password).
+        region : str, optional
+            Region included in the credential scope. Default is "us-east-1".
+        service : str, optional
+            Service included in the credential scope. Default is "s3".
+        """
+
+        self.access_key = access_key
+        self.region = region
+        self.service = service
+        self._secret_key = secret_key
+        # (date stamp, signing key) pair, replaced as a whole so readers never see a torn update
+        self._cached_signing_key: tuple[str, bytes] = ("", b"")
+
+
+    def _signing_key(self, date_stamp: str) -> bytes:
+        """
+        Return the signing key for the given date, deriving it only when the date changes.
+
+        Parameters
+        ----------
+        date_stamp : str
+            Date in `YYYYMMDD` format.
+
+        Returns
+        -------
+        bytes
+            The derived SigV4 signing key.
+        """
+
+        cached_date, cached_key = self._cached_signing_key
+        if cached_date == date_stamp:
+            return cached_key
+
+        key = ("AWS4" + self._secret_key).encode()
+        for part in (date_stamp, self.region, self.service, "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+
+        self._cached_signing_key = (date_stamp, key)
+        return key
+
+
+    def _scope(self, amz_date: str) -> str:
+        """
+        Build the credential scope for the given signing time.
+
+        Parameters
+        ----------
+        amz_date : str
+            Signing time in `YYYYMMDDTHHMMSSZ` format.
+
+        Returns
+        -------
+        str
+            The scope in the form `<date>/<region>/<service>/aws4_request`.
+        """
+
+        return f"{amz_date[:8]}/{self.region}/{self.service}/aws4_request"
+
+
+    def _signature(self, amz_date: str, scope: str, canonical_request: str) -> str:
+        """
+        Sign a canonical request with the cached signing key.
+
+        Parameters
+        ----------
+        amz_date : str
+            Signing time in `YYYYMMDDTHHMMSSZ` format.
+        scope : str
+            Credential scope built by `_scope`.
+        canonical_request : str
+            The SigV4 canonical request.
+
+        Returns
+        -------
+        str
+            Hex-encoded signature.
+        """
+
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        return hmac.new(
+            self._signing_key(amz_date[:8]), string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+
+
+    def sign(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        query: dict[str, str] | None = None,
+        payload_sha256: str = EMPTY_PAYLOAD_SHA256,
+        now: datetime | None = None,
+    ) -> dict[str, str]:
+        """
+        Compute the headers that authenticate a request.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method (e.g., 'DELETE').
+        host : str
+            Value of the Host header (host and, for non-default ports, port).
+        path : str
+            Already URI-encoded request path (e.g., '/bucket/key').
+        query : dict[str, str] | None, optional
+            Query string parameters, not yet encoded. Default is None.
+        payload_sha256 : str, optional
+            Hex SHA-256 digest of the request body. Default is the digest of an empty body.
+        now : datetime | None, optional
+            Signing time. Default is the current UTC time.
+
+        Returns
+        -------
+        dict[str, str]
+            Headers to send with the request: x-amz-date, x-amz-content-sha256 and Authorization.
+        """
+
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        scope = self._scope(amz_date)
+
+        signed_headers = "host;x-amz-content-sha256;x-amz-date"
+        canonical_request = (
+            f"{method}\n{path}\n{_canonical_query(query or {})}\n"
+            f"host:{host}\nx-amz-content-sha256:{payload_sha256}\nx-amz-date:{amz_date}\n\n"
+            f"{signed_headers}\n{payload_sha256}"
+        )
+        signature = self._signature(amz_date, scope, canonical_request)
+
+        return {
+            "x-amz-date": amz_date,
+            "x-amz-content-sha256": payload_sha256,
+            "Authorization": (
+                f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+                f"SignedHeaders={signed_headers}, Signature={signature}"
+            ),
+        }
+
+
+    def presign(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        expires: int,
+        headers: dict[str, str] | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        Compute the query string that authenticates a presigned URL.
+
+        The payload is not signed (`UNSIGNED-PAYLOAD`), as in presigned URLs generated by botocore.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method the URL is valid for (e.g., 'PUT').
+        host : str
+            Value of the Host header (host and, for non-default ports, port).
+        path : str
+            Already URI-encoded request path (e.g., '/bucket/key').
+        expires : int
+            Validity of the URL in seconds.
+        headers : dict[str, str] | None, optional
+            Headers besides Host that the request must be sent with (e.g., Content-Type),
+            keyed by lowercase name. Default is None.
+        now : datetime | None, optional
+            Signing time. Default is the current UTC time.
+
+        Returns
+        -------
+        str
+            Encoded query string including `X-Amz-Signature`, without the leading '?'.
+        """
+
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        scope = self._scope(amz_date)
+
+        signed = sorted({**(headers or {}), "host": host}.items())
+        signed_headers = ";".join(name for name, _ in signed)
+        canonical_headers = "".join(f"{name}:{value.strip()}\n" for name, value in signed)
+
+        canonical_query = _canonical_query({
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires),
+            "X-Amz-SignedHeaders": signed_headers,
+        })
+        canonical_request = (
+            f"{method}\n{path}\n{canonical_query}\n"
+            f"{canonical_headers}\n{signed_headers}\nUNSIGNED-PAYLOAD"
+        )
+        signature = self._signature(amz_date, scope, canonical_request)
+
+        return f"{canonical_query}&X-Amz-Signature={signature}"
+
+
+def _canonical_query(query: dict[str, str]) -> str:
+    """
+    Encode query parameters as the SigV4 canonical query string.
+
+    Parameters
+    ----------
+    query : dict[str, str]
+        Query string parameters, not yet encoded.
+
+    Returns
+    -------
+    str
+        Parameters sorted by name, with names and values URI-encoded.
+    """
+
+    return "&".join(
+        f"{quote(name, safe='~')}={quote(value, safe='~')}"
+        for name, value in sorted(query.items())
+    )
+
+
+# Initialize SigV4 signer singleton for the configured MinIO credentials.
+# Credentials are static for the application's lifetime, so the cached signing key
+# can be shared by all requests.
+signer = SigV4Signer(
+    access_key=minio_config.root_username,
+    secret_key=minio_config.root_password,
+)
+
+
+def _host_header(url: str) -> str:
+    """
+    Derive the Host header value that aiohttp sends for a URL.
+
+    The value is signed, so it must match what is actually sent: aiohttp lowercases the host
+    and omits the port when it is the default one for the scheme.
+
+    Parameters
+    ----------
+    url : str
+        Endpoint URL (e.g., 'http://localhost:9000').
+
+    Returns
+    -------
+    str
+        Host, followed by ':port' for non-default ports.
+    """
+
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    if parts.port is not None and parts.port == {'http': 80, 'https': 443}.get(parts.scheme):
+        return netloc.rsplit(':', 1)[0]
+    return netloc
+
+
+# Host header value for the configured MinIO endpoint.
+_endpoint_host = _host_header(minio_config.connection_url)
+
+# Shared aiohttp session, populated by `open_http_session()` and released by `close_http_session()`.
+_http_session: aiohttp.ClientSession | None = None
+
+
+def _build_http_session() -> aiohttp.ClientSession:
+    """
+    Build a new aiohttp session with a keep-alive connection pool.
+
+    The pool is sized like the aiobotocore client pool (`max_pool_connections`) and the connect
+    and read timeouts are the same, so low-level requests are bounded the same way as those sent
+    through aioboto3. Idle connections are kept open for reuse for 30 seconds.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        A session for requests to the configured MinIO endpoint.
+    """
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=minio_config.max_pool_connections, keepalive_timeout=30),
+        # No overall limit, as in botocore: large responses may take longer than any fixed total
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT),
+    )
+
+
+async def open_http_session() -> None:
+    """
+    Create the shared aiohttp session used by low-level requests.
+
+    Calling it again while the session is open is a no-op.
+    """
+
+    global _http_session
+
+    if _http_session is None:
+        _http_session = _build_http_session()
+
+
+async def close_http_session() -> None:
+    """
+    Close the shared aiohttp session opened by `open_http_session()`.
+
+    Calling it when no session is open is a no-op.
+    """
+
+    global _http_session
+
+    if _http_session is None:
+        return
+
+    session = _http_session
+    _http_session = None
+    await session.close()
+
+
+@asynccontextmanager
+async def get_http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Provide an aiohttp session for the duration of an `async with` block.
+
+    Yields the shared session if it has been opened with `open_http_session()`,
+    otherwise a short-lived session that is closed on exit.
+
+    Yields
+    ------
+    aiohttp.ClientSession
+        A session for requests to the configured MinIO endpoint.
+    """
+
+    if _http_session is not None:
+        yield _http_session
+        return
+
+    async with _build_http_session() as session:
+        yield session
+
+
+async def _raise_for_status(response: aiohttp.ClientResponse, operation_name: str) -> None:
+    """
+    Raise a botocore `ClientError` for an unsuccessful response.
+
+    Errors are reported the same way as by boto3 clients, so callers handle both request paths
+    with the same `except ClientError` blocks.
+
+    Parameters
+    ----------
+    response : aiohttp.ClientResponse
+        The response to check.
+    operation_name : str
+        Name of the S3 operation, used in the error message (e.g., 'DeleteObject').
+
+    Raises
+    ------
+    ClientError
+        If the response status is 300 or above.
+    """
+
+    if response.status < 300:
+        return
+
+    code, message = str(response.status), response.reason or ""
+    body = await response.read()
+    if body:
+        try:
+            error = ET.fromstring(body)
+            code = error.findtext("Code") or code
+            message = error.findtext("Message") or message
+        except ET.ParseError:
+            pass
+
+    raise ClientError(
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": response.status},
+        },
+        operation_name,
+    )
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Check whether a failed request may succeed when sent again.
+
+    Throttling, request timeouts, 5xx responses and connection failures (from botocore or aiohttp)
+    are transient. Other errors, e.g. AccessDenied or NoSuchBucket, would fail the same way again.
+
+    Parameters
+    ----------
+    error : BaseException
+        The error raised by a request.
+
+    Returns
+    -------
+    bool
+        True if the request should be retried.
+    """
+
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in RETRYABLE_ERROR_CODES or status >= 500
+    return isinstance(
+        error,
+        (BotoConnectionError, HTTPClientError, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+    )
+
+
+def bucket_path(bucket_name: str) -> str:
+    """
+    Build the URI-encoded path prefix of the objects in a bucket.
+
+    The bucket of a storage client never changes, so callers compute this once and append
+    `quote_key(storage_key)` per request instead of re-encoding the bucket name every time.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the bucket.
+
+    Returns
+    -------
+    str
+        Path prefix in the form `/<bucket>/`.
+    """
+
+    return f"/{quote(bucket_name, safe='')}/"
+
+
+def quote_key(storage_key: str) -> str:
+    """
+    URI-encode an object key for use in a request path, as required by SigV4 for S3.
+
+    Parameters
+    ----------
+    storage_key : str
+        Key of the object.
+
+    Returns
+    -------
+    str
+        The encoded key. Slashes are kept as path separators.
+    """
+
+    return quote(storage_key, safe='/~')
+
+
+async def _send(method: str, object_path: str, operation_name: str) -> CIMultiDictProxy[str]:
+    """
+    Send a signed body-less request, retrying transient failures.
+
+    Failures accepted by `is_retryable_error` are retried up to `MAX_ATTEMPTS` attempts in total,
+    with jittered exponential backoff, like botocore's retry handler. Every attempt is signed anew.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method (e.g., 'DELETE').
+    object_path : str
+        URI-encoded path of the object, i.e. `bucket_path(bucket_name) + quote_key(storage_key)`.
+    operation_name : str
+        Name of the S3 operation, used in error messages (e.g., 'DeleteObject').
+
+    Returns
+    -------
+    CIMultiDictProxy[str]
+        Headers of the successful response.
+
+    Raises
+    ------
+    ClientError
+        If the storage responds with an error that is permanent or persists over all attempts.
+    aiohttp.ClientError | asyncio.TimeoutError
+        If the storage cannot be reached over all attempts.
+    """
+
+    # `encoded=True` stops the URL from being re-quoted, which would break the signature
+    url = URL(minio_config.connection_url + object_path, encoded=True)
+
+    for attempt in range(MAX_ATTEMPTS):
+        headers = signer.sign(method, _endpoint_host, object_path)
+        try:
+            async with get_http_session() as session:
+                async with session.request(method, url, headers=headers) as response:
+                    await _raise_for_status(response, operation_name)
+                    return response.headers
+        except Exception as e:
+            if not is_retryable_error(e) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(random.random() * 2 ** attempt)
+
+
+async def delete_object(object_path: str) -> None:
+    """
+    Delete an object with a signed `DELETE` request, bypassing botocore.
+
+    Parameters
+    ----------
+    object_path : str
+        URI-encoded path of the object, i.e. `bucket_path(bucket_name) + quote_key(storage_key)`.
+
+    Raises
+    ------
+    ClientError
+        If the storage responds with an error.
+    """
+
+    await _send("DELETE", object_path, "DeleteObject")
+
+
+async def head_object(object_path: str) -> dict[str, Any]:
+    """
+    Inspect an object with a signed `HEAD` request, bypassing botocore.
+
+    Only the attributes needed for object summaries are parsed, which skips botocore's response
+    model processing on high fan-out metadata lookups.
+
+    Parameters
+    ----------
+    object_path : str
+        URI-encoded path of the object, i.e. `bucket_path(bucket_name) + quote_key(storage_key)`.
+
+    Returns
+    -------
+    dict[str, Any]
+        ContentLength, ETag and LastModified, typed and named like in boto3 `HeadObject` responses.
+
+    Raises
+    ------
+    ClientError
+        If the object does not exist (404) or the storage responds with another error.
+    """
+
+    headers = await _send("HEAD", object_path, "HeadObject")
+    return {
+        'ContentLength': int(headers['Content-Length']),
+        'ETag': headers['ETag'],
+        'LastModified': parsedate_to_datetime(headers['Last-Modified']),
+    }
+
+
+def presigned_url(
+    method: str,
+    object_path: str,
+    expires: int,
+    headers: dict[str, str] | None = None,
+    now: datetime | None = None,
+) -> str:
+    """
+    Build a presigned URL for an object on the configured MinIO endpoint without botocore.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method the URL is valid for (e.g., 'PUT').
+    object_path : str
+        URI-encoded path of the object, i.e. `bucket_path(bucket_name) + quote_key(storage_key)`.
+    expires : int
+        Validity of the URL in seconds.
+    headers : dict[str, str] | None, optional
+        Headers besides Host that the request must be sent with, keyed by lowercase name.
+        Default is None.
+    now : datetime | None, optional
+        Signing time. Passing the same time for a batch of URLs avoids re-reading the clock.
+        Default is the current UTC time.
+
+    Returns
+    -------
+    str
+        The presigned URL.
+    """
+
+    query = signer.presign(method, _endpoint_host, object_path, expires, headers=headers, now=now)
+    return f"{minio_config.connection_url}{object_path}?{query}"
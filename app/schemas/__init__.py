@@ -1,7 +1,11 @@
 # app/schemas/__init__.py
 from .upload_request import UploadFileRequest
+from .upload_stream_request import UploadStreamRequest
 from .get_metadata_request import GetFileMetadataRequest
+from .get_many_metadata_request import GetManyFilesMetadataRequest
 from .download_request import DownloadFileRequest
 from .delete_request import DeleteFileRequest
+from .delete_many_request import DeleteManyFilesRequest
+from .list_request import ListFilesRequest
 from .presigned_put_request import PresignedPutURLRequest
 from .presigned_get_request import PresignedGetURLRequest
\ No newline at end of file
@@ -0,0 +1,39 @@
+# app/schemas/delete_many_request.py
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from .utils import validate_clean_string
+
+
+class DeleteManyFilesRequest(BaseModel):
+    """
+    Request schema for deleting multiple objects from an S3-compatible object storage bucket via the REST API.
+    The bucket is determined by the service configuration, not by the request.
+    """
+
+    storage_keys: list[str] = Field(
+        ...,
+        min_length=1,
+        description=(
+            "Names of the objects to delete from the bucket. Must contain at least one key; "
+            "each key must be at least 1 character long and not blank."
+        )
+    )
+
+    @field_validator("storage_keys")
+    @classmethod
+    def storage_keys_clean_strings(cls, v: list[str]) -> list[str]:
+        """Validate that every storage key is non-empty, non-blank and has no leading/trailing whitespace."""
+        for key in v:
+            validate_clean_string(key, "Object name")
+        return v
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "storage_keys": ["critique-of-pure-reason.pdf", "critique-of-practical-reason.pdf"]
+                }
+            ]
+        }
+    )
\ No newline at end of file
@@ -25,6 +25,7 @@ class DeleteFileRequest(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -1,5 +1,4 @@
 # app/schemas/download_request.py
-from pathlib import Path
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from .utils import validate_clean_string
 
@@ -23,7 +22,8 @@ class DownloadFileRequest(BaseModel):
         min_length=1,
         description=(
             "Local filesystem path where the downloaded file will be saved. "
-            "The parent directory must exist and be a valid directory."
+            "The parent directory must exist and be a valid directory; "
+            "this is checked by the storage client at download time."
         )
     )
 
@@ -35,20 +35,13 @@ class DownloadFileRequest(BaseModel):
 
     @field_validator("file_path")
     @classmethod
-    def file_path_not_blank_and_parent_exists(cls, v: str) -> str:
-        """
-        Validate that the file path is non-empty, non-blank, has no leading/trailing whitespace
-        and its parent directory exists and is a directory.
-        """
-        
-        validate_clean_string(v, "File path")
-        parent = Path(v).parent
-        if not parent.is_dir():
-            raise ValueError(f"Parent path is not a directory: {parent}")
-        return v
+    def file_path_clean_string(cls, v: str) -> str:
+        """Validate that file path is non-empty, non-blank and has no leading/trailing whitespace."""
+        return validate_clean_string(v, "File path")
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
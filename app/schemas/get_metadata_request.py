@@ -25,6 +25,7 @@ class GetFileMetadataRequest(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
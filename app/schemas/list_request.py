@@ -0,0 +1,37 @@
+# app/schemas/list_request.py
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class ListFilesRequest(BaseModel):
+    """
+    Request schema for listing objects in an S3-compatible object storage bucket via the REST API.
+    The bucket is determined by the service configuration, not by the request.
+    """
+
+    prefix: str = Field(
+        "",
+        description=(
+            "Only objects whose names start with this prefix are listed. Default is '' (all objects)."
+        )
+    )
+
+    max_keys: int = Field(
+        1000,
+        ge=1,
+        description=(
+            "Maximum number of objects to return. Must be at least 1. Default is 1000."
+        )
+    )
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "prefix": "kant/",
+                    "max_keys": 100
+                }
+            ]
+        }
+    )
\ No newline at end of file
@@ -27,6 +27,14 @@ class PresignedGetURLRequest(BaseModel):
         )
     )
 
+    verify_exists: bool = Field(
+        False,
+        description=(
+            "Whether to check that the object exists before signing the URL. "
+            "Costs one HEAD request; without it, a URL for a missing object fails on download. Default is False."
+        )
+    )
+
     @field_validator("storage_key")
     @classmethod
     def attributes_clean_string(cls, v: str) -> str:
@@ -35,6 +43,7 @@ class PresignedGetURLRequest(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -43,6 +43,7 @@ class PresignedPutURLRequest(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -1,5 +1,4 @@
 # app/schemas/upload_request.py
-import os
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from .utils import validate_clean_string
 
@@ -22,7 +21,8 @@ class UploadFileRequest(BaseModel):
         ...,
         min_length=1,
         description=(
-            "Local filesystem path to the file to be uploaded. Must point to an existing regular file."
+            "Local filesystem path to the file to be uploaded. Must point to an existing regular file; "
+            "this is checked by the storage client at upload time."
         )
     )
 
@@ -32,16 +32,9 @@ class UploadFileRequest(BaseModel):
         """Validate that string fields are non-empty, non-blank and has no leading/trailing whitespace."""
         return validate_clean_string(v, "Name")
 
-    @field_validator("file_path")
-    @classmethod
-    def file_path_exists(cls, v: str) -> str:
-        """Validate that the specified file path corresponds to an existing file on disk."""
-        if not os.path.isfile(v):
-            raise ValueError(f"File not found: {v}")
-        return v
-
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={
             "examples": [
                 {
@@ -0,0 +1,47 @@
+# app/schemas/upload_stream_request.py
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from .utils import validate_clean_string
+
+
+class UploadStreamRequest(BaseModel):
+    """
+    Request schema for uploading a stream of bytes (e.g., an incoming request body) to an S3-compatible
+    object storage bucket via the REST API, without spooling it to a local file first.
+    The target bucket is determined by the service configuration, not by the request.
+    """
+
+    storage_key: str = Field(
+        ...,
+        min_length=1,
+        description=(
+            "Name to assign to the uploaded object in the bucket. Must be at least 1 character long and not blank."
+        )
+    )
+
+    content_type: str = Field(
+        "binary/octet-stream",
+        min_length=1,
+        description=(
+            "MIME type of the streamed content (e.g., 'image/png', 'application/pdf'). "
+            "Must be a valid, non-blank string. Default is 'binary/octet-stream'."
+        )
+    )
+
+    @field_validator("storage_key", "content_type")
+    @classmethod
+    def attributes_clean_string(cls, v: str) -> str:
+        """Validate that string fields are non-empty, non-blank and have no leading/trailing whitespace."""
+        return validate_clean_string(v, "Value")
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "storage_key": "critique-of-pure-reason.pdf",
+                    "content_type": "application/pdf"
+                }
+            ]
+        }
+    )
\ No newline at end of file
@@ -27,8 +27,10 @@ def validate_clean_string(value: str, field_name: str = "Value") -> str:
     
     if not value:
         raise ValueError(f"{field_name} cannot be empty")
-    if not value.strip():
-        raise ValueError(f"{field_name} cannot be blank")
-    if value != value.strip():
+    # Checking only the boundary characters avoids allocating stripped copies on the happy path.
+    # A blank string always starts with whitespace, so it is detected inside this branch.
+    if value[0].isspace() or value[-1].isspace():
+        if not value.strip():
+            raise ValueError(f"{field_name} cannot be blank")
         raise ValueError(f"{field_name} must not have leading or trailing whitespace")
     return value
\ No newline at end of file
@@ -1,18 +1,45 @@
 # app/sync_client.py
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
+import itertools
+import multiprocessing
 import os
+import stat
 import mimetypes
+from datetime import datetime, timezone
+from functools import partial
+from boto3.s3.transfer import S3Transfer, TransferConfig
 from botocore.exceptions import ClientError
 from .schemas import (
     UploadFileRequest, 
+    UploadStreamRequest, 
     DownloadFileRequest, 
     DeleteFileRequest, 
+    DeleteManyFilesRequest, 
     GetFileMetadataRequest, 
+    GetManyFilesMetadataRequest, 
+    ListFilesRequest, 
     PresignedPutURLRequest, 
     PresignedGetURLRequest
 )
 from .config import minio_config
-from .utils import get_client, setup_lifecycle, create_bucket_if_not_exists
+from .lowlevel import bucket_path, quote_key, presigned_url
+from .utils import (
+    DELETE_OBJECTS_MAX_KEYS,
+    UPLOAD_PART_SIZE,
+    MULTIPART_MAX_PARTS,
+    plan_metadata_lookup,
+    object_summary,
+    object_summary_from_head,
+    OBJECT_SUMMARY_FIELDS,
+    is_not_found_error,
+    build_extension_mime_map,
+    PresignedURLCache,
+    TRANSFER_CONFIG,
+    get_client,
+    upload_file_part,
+    setup_bucket,
+    bootstrap_storage
+)
 
 
 class ObjectStorageClient:
@@ -23,8 +50,9 @@ class ObjectStorageClient:
     The client is designed to be instantiated per bucket rather than subclassed because all buckets
     follow the same operational semantics without bucket-specific rules that would justify inheritance.
 
-    Each public method creates a fresh S3 client on-demand. Input data is assumed to be pre-validated
-    by Pydantic schemas before reaching these methods.
+    All methods share the module-level S3 client returned by `get_client()`, so connections are
+    pooled across calls. Input data is assumed to be pre-validated by Pydantic schemas before
+    reaching these methods.
 
     Attributes
     ----------
@@ -32,18 +60,36 @@ class ObjectStorageClient:
         The name of the bucket this client instance operates on.
     max_file_size : int
         Maximum allowed file size in bytes.
-    allowed_mime_types : set[str]
-        Set of allowed MIME types.
+    allowed_mime_types : frozenset[str] | None
+        Set of allowed MIME types, or None to allow any type.
     expiration_days : int | None
         Number of days after which objects are automatically deleted, or None for no expiration.
+    transfer_config : TransferConfig
+        Settings of the managed transfers (multipart uploads and downloads) of this bucket.
     """
 
+    # Instances hold a fixed set of attributes, so skip the per-instance `__dict__`
+    __slots__ = (
+        'bucket_name',
+        'max_file_size',
+        'allowed_mime_types',
+        'expiration_days',
+        'transfer_config',
+        '_mime_type_error_suffix',
+        '_extension_mime_map',
+        '_presigned_url_cache',
+        '_client',
+        '_transfer',
+        '_object_path_prefix',
+    )
+
     def __init__(
         self,
         bucket_name: str,
         max_file_size: int,
         allowed_mime_types: list[str],
         expiration_days: int | None = None,
+        transfer_config: TransferConfig | None = None,
     ):
         """
         Initialize the target bucket and optional constraints.
@@ -58,43 +104,136 @@ class ObjectStorageClient:
         max_file_size : int
             Maximum file size in bytes.
         allowed_mime_types : list[str]
-            list of allowed MIME types. Internally converted to a set for performance.
+            list of allowed MIME types. Internally converted to a frozenset for performance.
         expiration_days : int | None, optional
             Number of days after which objects in the bucket are automatically deleted.
             If None, no expiration policy is set. Default is None.
+        transfer_config : TransferConfig | None, optional
+            Settings of managed transfers, e.g. smaller parts for a bucket of small images.
+            If None, the shared `TRANSFER_CONFIG` is used. Default is None.
         """
         
         self.bucket_name = bucket_name
         self.max_file_size = max_file_size
-        self.allowed_mime_types = set(allowed_mime_types) if allowed_mime_types is not None else None
+        self.allowed_mime_types = frozenset(allowed_mime_types) if allowed_mime_types is not None else None
+        # Tail of the rejection message, built once instead of sorting the allowed types per rejection
+        self._mime_type_error_suffix = (
+            f"Allowed types: {sorted(self.allowed_mime_types)}" if allowed_mime_types is not None else ""
+        )
         self.expiration_days = expiration_days
+        self.transfer_config = transfer_config if transfer_config is not None else TRANSFER_CONFIG
+        # Extension -> MIME type lookup for the allowed types, consulted before `mimetypes`
+        self._extension_mime_map = build_extension_mime_map(self.allowed_mime_types)
+        # Recently generated presigned URLs, keyed by their (frozen, hashable) request
+        self._presigned_url_cache = PresignedURLCache()
+        self._client = get_client()
+        # Transfer manager reused by all managed transfers, so its worker threads are started once
+        self._transfer = S3Transfer(client=self._client, config=self.transfer_config)
+        # Encoded `/<bucket>/` path prefix for low-level requests, computed once per bucket
+        self._object_path_prefix = bucket_path(bucket_name)
 
-        create_bucket_if_not_exists(bucket_name=self.bucket_name)
+        setup_bucket(bucket_name=self.bucket_name, expiration_days=self.expiration_days)
 
-        if self.expiration_days is not None:
-            setup_lifecycle(bucket_name=self.bucket_name, expiration_days=self.expiration_days)
 
+    def close(self) -> None:
+        """
+        Shut down the transfer manager and its worker threads.
 
-    def _validate_file_size(self, file_path: str) -> None:
+        Meant to be called on application shutdown; managed transfers (`upload` of large files and
+        `download`) cannot be used afterwards. In-progress transfers are allowed to finish.
         """
-        Validate that the file size does not exceed the configured maximum.
+
+        self._transfer.__exit__(None, None, None)
+
+
+    def _open_file(self, file_path: str) -> BinaryIO:
+        """
+        Open an existing regular local file for reading in binary mode.
+
+        The file is opened non-blocking, so that a FIFO or device path is rejected instead of
+        blocking until a writer appears, and switched back to blocking mode once it is known
+        to be a regular file.
 
         Parameters
         ----------
         file_path : str
-            Path to the file to validate.
+            Path to the file to open.
+
+        Returns
+        -------
+        BinaryIO
+            The open file. The caller is responsible for closing it.
+
+        Raises
+        ------
+        ValueError
+            If the file does not exist or is not a regular file.
+        """
+
+        try:
+            file = open(file_path, 'rb', opener=lambda path, flags: os.open(path, flags | os.O_NONBLOCK))
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise ValueError(f"File not found: {file_path}") from None
+
+        if not stat.S_ISREG(os.fstat(file.fileno()).st_mode):
+            file.close()
+            raise ValueError(f"File not found: {file_path}")
+        os.set_blocking(file.fileno(), True)
+        return file
+
+
+    def _validate_parent_directory(self, file_path: str) -> None:
+        """
+        Validate that the parent directory of the given path exists and is a directory.
+
+        Parameters
+        ----------
+        file_path : str
+            Path whose parent directory to validate.
+
+        Raises
+        ------
+        ValueError
+            If the parent path does not exist or is not a directory.
+        """
+
+        parent = os.path.dirname(file_path) or "."
+        try:
+            mode = os.stat(parent).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"Parent path does not exist: {parent}") from None
+        if not stat.S_ISDIR(mode):
+            raise ValueError(f"Parent path is not a directory: {parent}")
+
+
+    def _validate_file_size(self, file: BinaryIO) -> int:
+        """
+        Validate that an open file does not exceed the configured maximum size.
+
+        The file is inspected with `fstat` on its descriptor, so no further path lookups are needed.
+
+        Parameters
+        ----------
+        file : BinaryIO
+            The open file to validate.
+
+        Returns
+        -------
+        int
+            The size of the file in bytes.
 
         Raises
         ------
         ValueError
-            If file size exceeds max_file_size.
+            If the file size exceeds max_file_size.
         """
 
-        file_size = os.path.getsize(file_path)
-        if file_size > self.max_file_size:
+        file_stat = os.fstat(file.fileno())
+        if file_stat.st_size > self.max_file_size:
             raise ValueError(
-                f"File size {file_size} bytes exceeds maximum allowed size of {self.max_file_size} bytes"
+                f"File size {file_stat.st_size} bytes exceeds maximum allowed size of {self.max_file_size} bytes"
             )
+        return file_stat.st_size
 
 
     def _validate_mime_type(self, mime_type: str) -> None:
@@ -115,14 +254,144 @@ class ObjectStorageClient:
         if self.allowed_mime_types is not None:
             if mime_type not in self.allowed_mime_types:
                 raise ValueError(
-                    f"MIME type '{mime_type}' is not allowed. Allowed types: {sorted(self.allowed_mime_types)}"
+                    f"MIME type '{mime_type}' is not allowed. {self._mime_type_error_suffix}"
                 )
 
 
+    def _guess_mime_type(self, file_path: str) -> str | None:
+        """
+        Guess the MIME type of a file from its extension.
+
+        Extensions of the allowed MIME types are resolved with a dictionary lookup; only other
+        extensions go through `mimetypes.guess_type`.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        str | None
+            The guessed MIME type, or None if it cannot be determined.
+        """
+
+        # The extension's case is kept: `guess_type` tries it case-sensitively first
+        mime_type = self._extension_mime_map.get(os.path.splitext(file_path)[1])
+        if mime_type is None:
+            mime_type, _ = mimetypes.guess_type(file_path)
+        return mime_type
+
+
+    def _head_object_summary(self, storage_key: str) -> dict[str, Any] | None:
+        """
+        Inspect a single object with a HEAD request.
+
+        Parameters
+        ----------
+        storage_key : str
+            Key of the object to inspect.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The object summary, or None if the object does not exist.
+        """
+
+        try:
+            response = self._client.head_object(Bucket=self.bucket_name, Key=storage_key)
+        except ClientError as e:
+            if is_not_found_error(e):
+                return None
+            raise
+        return object_summary_from_head(storage_key, response)
+
+
+    def _list_object_summaries(
+        self,
+        prefix: str,
+        storage_keys: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Inspect a group of objects sharing a prefix with a single LIST request.
+
+        Keys missing from the listing are reported as non-existent, unless the listing was truncated,
+        in which case they are inspected individually with HEAD requests.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix common to all keys in the group.
+        storage_keys : list[str]
+            Keys of the objects to inspect.
+
+        Returns
+        -------
+        dict[str, dict[str, Any] | None]
+            Mapping of key to object summary (None if the object does not exist).
+        """
+
+        response = self._client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix, MaxKeys=1000)
+        listed = {obj['Key']: obj for obj in response.get('Contents', [])}
+        truncated = response.get('IsTruncated', False)
+
+        results = {}
+        for key in storage_keys:
+            if key in listed:
+                results[key] = object_summary(listed[key])
+            elif truncated:
+                results[key] = self._head_object_summary(key)
+            else:
+                results[key] = None
+        return results
+
+
+    def _upload_part(
+        self,
+        storage_key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes
+    ) -> dict[str, Any]:
+        """
+        Upload one part of a multipart upload.
+
+        Parameters
+        ----------
+        storage_key : str
+            Key of the object being uploaded.
+        upload_id : str
+            ID of the multipart upload.
+        part_number : int
+            1-based number of the part.
+        data : bytes
+            Content of the part.
+
+        Returns
+        -------
+        dict[str, Any]
+            The part entry (PartNumber and ETag) expected by `CompleteMultipartUpload`.
+        """
+
+        response = self._client.upload_part(
+            Body=data,
+            Bucket=self.bucket_name,
+            Key=storage_key,
+            UploadId=upload_id,
+            PartNumber=part_number
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+
     def upload(self, request: UploadFileRequest) -> None:
         """
         Upload a local file to the bucket under the specified storage key.
 
+        The file is opened once and validated with `fstat` on the open descriptor. Files up to
+        `multipart_threshold` bytes are sent from the open file with a single `PutObject` request.
+        Larger ones are uploaded in parts with `upload_file`, whose worker threads each read their
+        own part from the file instead of waiting for one thread to read every part.
+
         Parameters
         ----------
         request : UploadFileRequest
@@ -132,21 +401,190 @@ class ObjectStorageClient:
         Raises
         ------
         ValueError
-            If file validation fails (size or MIME type constraints).
+            If file validation fails (missing file, size or MIME type constraints).
         ClientError
             If the upload operation fails.
         """
 
-        self._validate_file_size(request.file_path)
-        mime_type, _ = mimetypes.guess_type(request.file_path)
-        self._validate_mime_type(mime_type)
+        with self._open_file(request.file_path) as file:
+            file_size = self._validate_file_size(file)
+            mime_type = self._guess_mime_type(request.file_path)
+            self._validate_mime_type(mime_type)
+
+            if file_size <= self.transfer_config.multipart_threshold:
+                self._client.put_object(
+                    Body=file,
+                    Bucket=self.bucket_name,
+                    Key=request.storage_key,
+                    ContentLength=file_size
+                )
+                return
+
+        self._transfer.upload_file(
+            filename=request.file_path,
+            bucket=self.bucket_name,
+            key=request.storage_key
+        )
+
 
-        client = get_client()
-        client.upload_file(
-            Filename=request.file_path,
+    def upload_large(self, request: UploadFileRequest, *, processes: int = 4) -> None:
+        """
+        Upload a very large local file with parts sent from several worker processes.
+
+        Threads of a managed transfer share one interpreter, so signing and preparing parts
+        contend for the GIL. Here each worker process owns its client and connection pool and
+        reads its own byte ranges from the file, so no part data crosses process boundaries.
+        The multipart upload is created and completed by the calling process and aborted if
+        any part fails. Files up to `multipart_threshold` bytes are uploaded with `upload`.
+
+        Workers are started with the "spawn" method, which re-imports the main module in each of
+        them, so scripts calling this must guard their entry point with `if __name__ == "__main__":`.
+        Storage clients built during that re-import skip their bucket setup, which the calling
+        process has already done.
+
+        Parameters
+        ----------
+        request : UploadFileRequest
+            Validated request containing storage_key (the key/path under which to store the file)
+            and file_path (absolute or relative path to an existing local file).
+        processes : int, optional
+            Number of worker processes. Default is 4.
+
+        Raises
+        ------
+        ValueError
+            If file validation fails (missing file, size or MIME type constraints).
+        ClientError
+            If the upload operation fails.
+        """
+
+        with self._open_file(request.file_path) as file:
+            file_size = self._validate_file_size(file)
+            mime_type = self._guess_mime_type(request.file_path)
+            self._validate_mime_type(mime_type)
+
+        if file_size <= self.transfer_config.multipart_threshold:
+            self.upload(request)
+            return
+
+        # Grow the parts beyond the configured size only if the file would need too many of them
+        part_size = max(self.transfer_config.multipart_chunksize, -(-file_size // MULTIPART_MAX_PARTS))
+
+        upload_id = self._client.create_multipart_upload(
             Bucket=self.bucket_name,
             Key=request.storage_key
-        )
+        )['UploadId']
+        tasks = [
+            (
+                self.bucket_name, request.storage_key, upload_id, part_number,
+                request.file_path, offset, min(part_size, file_size - offset)
+            )
+            for part_number, offset in enumerate(range(0, file_size, part_size), start=1)
+        ]
+
+        try:
+            # Spawned rather than forked: this process runs threads (e.g., of the transfer manager),
+            # and forking a multi-threaded process can deadlock the child
+            with multiprocessing.get_context("spawn").Pool(processes) as pool:
+                parts = pool.starmap(upload_file_part, tasks)
+
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=request.storage_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except BaseException:
+            self._client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=request.storage_key,
+                UploadId=upload_id
+            )
+            raise
+
+
+    def upload_stream(self, request: UploadStreamRequest, body: Iterable[bytes]) -> None:
+        """
+        Upload a stream of bytes to the bucket under the specified storage key.
+
+        The data is never written to a local file. Chunks are buffered until a full part
+        (`UPLOAD_PART_SIZE`) is available: a stream that ends before that is sent with a single
+        `PutObject` request, a longer one is sent as a multipart upload.
+        If anything fails, the multipart upload is aborted so no orphaned parts are left behind.
+
+        Parameters
+        ----------
+        request : UploadStreamRequest
+            Validated request containing storage_key and content_type.
+        body : Iterable[bytes]
+            Chunks of the content to upload, in order.
+
+        Raises
+        ------
+        ValueError
+            If content_type is not allowed or the streamed data exceeds max_file_size.
+        ClientError
+            If the upload operation fails.
+        """
+
+        self._validate_mime_type(request.content_type)
+
+        buffer = bytearray()
+        total_size = 0
+        upload_id = None
+        parts = []
+
+        try:
+            for chunk in body:
+                total_size += len(chunk)
+                if total_size > self.max_file_size:
+                    raise ValueError(
+                        f"Streamed data exceeds maximum allowed size of {self.max_file_size} bytes"
+                    )
+                buffer += chunk
+
+                while len(buffer) >= UPLOAD_PART_SIZE:
+                    if upload_id is None:
+                        upload_id = self._client.create_multipart_upload(
+                            Bucket=self.bucket_name,
+                            Key=request.storage_key,
+                            ContentType=request.content_type
+                        )['UploadId']
+
+                    parts.append(self._upload_part(
+                        request.storage_key, upload_id, len(parts) + 1, bytes(buffer[:UPLOAD_PART_SIZE])
+                    ))
+                    del buffer[:UPLOAD_PART_SIZE]
+
+            if upload_id is None:
+                self._client.put_object(
+                    Body=bytes(buffer),
+                    Bucket=self.bucket_name,
+                    Key=request.storage_key,
+                    ContentType=request.content_type
+                )
+                return
+
+            if buffer:
+                parts.append(self._upload_part(
+                    request.storage_key, upload_id, len(parts) + 1, bytes(buffer)
+                ))
+
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=request.storage_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except BaseException:
+            if upload_id is not None:
+                self._client.abort_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=request.storage_key,
+                    UploadId=upload_id
+                )
+            raise
+
 
     def download(self, request: DownloadFileRequest) -> None:
         """
@@ -160,15 +598,18 @@ class ObjectStorageClient:
 
         Raises
         ------
+        ValueError
+            If the parent directory of file_path does not exist.
         ClientError
             If the object does not exist (NoSuchKey) or the download operation fails.
         """
         
-        client = get_client()
-        client.download_file(
-            Bucket=self.bucket_name,
-            Key=request.storage_key,
-            Filename=request.file_path
+        self._validate_parent_directory(request.file_path)
+
+        self._transfer.download_file(
+            bucket=self.bucket_name,
+            key=request.storage_key,
+            filename=request.file_path
         )
 
 
@@ -190,13 +631,53 @@ class ObjectStorageClient:
             If the delete operation fails for reasons other than the object not existing.
         """
         
-        client = get_client()
-        client.delete_object(
+        self._client.delete_object(
             Bucket=self.bucket_name,
             Key=request.storage_key
         )
 
 
+    def delete_many(self, request: DeleteManyFilesRequest) -> list[dict[str, Any]]:
+        """
+        Delete multiple objects from the bucket using batched `DeleteObjects` requests.
+
+        Keys are sent in chunks of up to 1000 (the S3 per-request limit), so deleting N objects
+        costs ceil(N / 1000) round trips instead of N. As with `delete`, deleting
+        non-existent objects is not an error.
+
+        Parameters
+        ----------
+        request : DeleteManyFilesRequest
+            Validated request containing storage_keys (keys of the objects to delete).
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Per-object errors reported by the storage, each containing Key, Code and Message.
+            An empty list means every object was deleted.
+
+        Raises
+        ------
+        ClientError
+            If a batch delete request fails as a whole.
+        """
+
+        keys = request.storage_keys
+        errors = []
+
+        for i in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS):
+            response = self._client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    'Objects': [{'Key': key} for key in keys[i:i + DELETE_OBJECTS_MAX_KEYS]],
+                    'Quiet': True
+                }
+            )
+            errors.extend(response.get('Errors', []))
+
+        return errors
+
+
     def get_metadata(self, request: GetFileMetadataRequest) -> dict[str, Any]:
         """
         Retrieve metadata about a specific object in the bucket.
@@ -221,14 +702,149 @@ class ObjectStorageClient:
             If the object does not exist (404 NotFound).
         """
         
-        client = get_client()
-        return client.head_object(Bucket=self.bucket_name, Key=request.storage_key)
+        return self._client.head_object(Bucket=self.bucket_name, Key=request.storage_key)
+
+
+    def get_metadata_many(self, request: GetManyFilesMetadataRequest) -> dict[str, dict[str, Any] | None]:
+        """
+        Retrieve summary metadata about multiple objects in the bucket.
+
+        Small lookups issue one HEAD request per key. Larger lookups group keys by a shared
+        prefix and resolve each group with a single `ListObjectsV2` request, falling back to HEAD
+        only for keys a truncated listing did not cover. This turns N round trips into roughly
+        one per distinct prefix.
+
+        Parameters
+        ----------
+        request : GetManyFilesMetadataRequest
+            Validated request containing storage_keys (keys of the objects to inspect).
+
+        Returns
+        -------
+        dict[str, dict[str, Any] | None]
+            Mapping of each requested key to its summary (Key, Size, ETag, LastModified),
+            or None if the object does not exist. Keys appear in request order.
+
+        Raises
+        ------
+        ClientError
+            If a HEAD or LIST request fails for reasons other than a missing object.
+        """
+
+        head_keys, list_groups = plan_metadata_lookup(request.storage_keys)
+
+        summaries = {key: self._head_object_summary(key) for key in head_keys}
+        for prefix, keys in list_groups.items():
+            summaries.update(self._list_object_summaries(prefix, keys))
+        return {key: summaries[key] for key in request.storage_keys}
+
+
+    def iter_all(self, prefix: str = "", page_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all objects in the bucket, fetching them page by page.
+
+        Pages are requested lazily with the `ListObjectsV2` paginator, so memory usage is bounded
+        by the page size and iteration can stop early without listing the rest of the bucket.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Only objects whose keys start with this prefix are listed. Default is '' (all objects).
+        page_size : int, optional
+            Number of objects requested per page, capped at 1000 (the S3 limit). Default is 1000.
+
+        Yields
+        ------
+        dict[str, Any]
+            Raw `ListObjectsV2` entries, including Key, Size, ETag and LastModified.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        paginator = self._client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': min(page_size, 1000)}
+        ):
+            yield from page.get('Contents', [])
+
+
+    def get_all(self, request: ListFilesRequest) -> list[dict[str, Any]]:
+        """
+        List objects in the bucket, following pagination up to the requested number of objects.
+
+        Parameters
+        ----------
+        request : ListFilesRequest
+            Validated request containing prefix and max_keys.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Raw `ListObjectsV2` entries, including Key, Size, ETag and LastModified,
+            in lexicographical key order.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        objects = self.iter_all(prefix=request.prefix, page_size=min(request.max_keys, 1000))
+        return list(itertools.islice(objects, request.max_keys))
+
+
+    def get_all_columnar(
+        self,
+        request: ListFilesRequest,
+        fields: tuple[str, ...] = OBJECT_SUMMARY_FIELDS
+    ) -> dict[str, list[Any]]:
+        """
+        List objects in the bucket like `get_all`, but return their attributes column by column.
+
+        Instead of one dict per object, a single list per requested attribute is built, which takes
+        far less memory for large listings and suits aggregations over a single attribute
+        (e.g., `sum(columns['Size'])`). Requesting only the needed fields skips the others entirely.
+
+        Parameters
+        ----------
+        request : ListFilesRequest
+            Validated request containing prefix and max_keys.
+        fields : tuple[str, ...], optional
+            `ListObjectsV2` entry attributes to collect. Default is Key, Size, ETag and LastModified.
+
+        Returns
+        -------
+        dict[str, list[Any]]
+            Mapping of each requested attribute to its values, aligned by object
+            and in lexicographical key order.
+
+        Raises
+        ------
+        ClientError
+            If a listing request fails.
+        """
+
+        columns = {field: [] for field in fields}
+        appenders = [(field, columns[field].append) for field in fields]
+
+        objects = self.iter_all(prefix=request.prefix, page_size=min(request.max_keys, 1000))
+        for obj in itertools.islice(objects, request.max_keys):
+            for field, append in appenders:
+                append(obj[field])
+        return columns
 
 
     def generate_presigned_put_url(self, request: PresignedPutURLRequest) -> str:
         """
         Generate a presigned URL for uploading an object directly to the storage bucket.
 
+        URLs are reused for repeated identical requests for a short time (see `PresignedURLCache`).
+
         This enables client-side uploads without routing data through the application server,
         reducing bandwidth costs and latency. The client must include the correct Content-Type
         header when making the PUT request.
@@ -252,8 +868,11 @@ class ObjectStorageClient:
         
         self._validate_mime_type(request.content_type)
 
-        client = get_client()
-        return client.generate_presigned_url(
+        url = self._presigned_url_cache.get(request)
+        if url is not None:
+            return url
+
+        url = self._client.generate_presigned_url(
             'put_object',
             Params={
                 'Bucket': self.bucket_name,
@@ -262,34 +881,90 @@ class ObjectStorageClient:
             },
             ExpiresIn=request.expires
         )
+        self._presigned_url_cache.put(request, url, request.expires)
+        return url
+
+
+    def generate_presigned_put_urls(self, requests: list[PresignedPutURLRequest]) -> list[str]:
+        """
+        Generate presigned upload URLs for many objects at once.
+
+        The URLs are signed directly with the cached SigV4 signing key and a single timestamp,
+        instead of going through botocore's request pipeline once per URL. They are equivalent
+        to those of `generate_presigned_put_url`: the client must send the same Content-Type.
+
+        Parameters
+        ----------
+        requests : list[PresignedPutURLRequest]
+            Validated requests, each containing storage_key, expires, and content_type.
+
+        Returns
+        -------
+        list[str]
+            Temporary upload URLs, in the order of `requests`.
+
+        Raises
+        ------
+        ValueError
+            If the `content_type` of any request is not allowed according to `allowed_mime_types`.
+            No URL is generated in that case.
+        """
+
+        for request in requests:
+            self._validate_mime_type(request.content_type)
+
+        now = datetime.now(timezone.utc)
+        return [
+            presigned_url(
+                'PUT',
+                self._object_path_prefix + quote_key(request.storage_key),
+                request.expires,
+                headers={'content-type': request.content_type},
+                now=now
+            )
+            for request in requests
+        ]
+
 
     def generate_presigned_get_url(self, request: PresignedGetURLRequest) -> str:
         """
         Generate a presigned URL for downloading an object from the storage bucket.
 
+        URLs are reused for repeated identical requests for a short time (see `PresignedURLCache`).
+
         This enables client-side downloads without routing data through the application server,
         reducing bandwidth costs and improving performance for large files.
 
+        Signing is a local computation. The object is only checked for existence (with a HEAD
+        request) when `verify_exists` is set; otherwise a URL for a missing object fails on download.
+
         Parameters
         ----------
         request : PresignedGetURLRequest
-            Validated request containing storage_key and expires.
+            Validated request containing storage_key, expires and verify_exists.
 
         Returns
         -------
         str
             A temporary URL that allows direct download from the object storage.
             The URL is only valid for the specified expiration period.
+
+        Raises
+        ------
+        ClientError
+            If verify_exists is set and the object does not exist (404) or the check fails.
         """
 
-        try:
-            metadata_request = GetFileMetadataRequest(storage_key=request.storage_key)
+        if request.verify_exists:
+            # The storage key has already been validated by `PresignedGetURLRequest`
+            metadata_request = GetFileMetadataRequest.model_construct(storage_key=request.storage_key)
             self.get_metadata(metadata_request)
-        except ClientError as e:
-            raise
 
-        client = get_client()
-        return client.generate_presigned_url(
+        url = self._presigned_url_cache.get(request)
+        if url is not None:
+            return url
+
+        url = self._client.generate_presigned_url(
             'get_object',
             Params={
                 'Bucket': self.bucket_name,
@@ -297,6 +972,8 @@ class ObjectStorageClient:
             },
             ExpiresIn=request.expires
         )
+        self._presigned_url_cache.put(request, url, request.expires)
+        return url
 
 
 # Initialize ObjectStorageClient singletons for predefined buckets.
@@ -304,17 +981,23 @@ class ObjectStorageClient:
 # via minio_config, and these bucket names remain constant for the application's lifetime,
 # it is safe, efficient, and semantically correct to instantiate dedicated ObjectStorageClient
 # instances once at module level.
-
-documents_storage_client = ObjectStorageClient(
-    bucket_name=minio_config.documents_bucket_name,
-    max_file_size=minio_config.documents_max_file_size,
-    allowed_mime_types=minio_config.documents_allowed_mime_types,
-    expiration_days=minio_config.documents_expiration_days
+#
+# Each instance sets up its bucket on construction (see `__init__`), so both are constructed
+# concurrently by `bootstrap_storage()` and their setup round trips overlap.
+
+documents_storage_client, images_storage_client = bootstrap_storage(
+    partial(
+        ObjectStorageClient,
+        bucket_name=minio_config.documents_bucket_name,
+        max_file_size=minio_config.documents_max_file_size,
+        allowed_mime_types=minio_config.documents_allowed_mime_types,
+        expiration_days=minio_config.documents_expiration_days
+    ),
+    partial(
+        ObjectStorageClient,
+        bucket_name=minio_config.images_bucket_name,
+        max_file_size=minio_config.images_max_file_size,
+        allowed_mime_types=minio_config.images_allowed_mime_types,
+        expiration_days=minio_config.images_expiration_days
+    ),
 )
-
-images_storage_client = ObjectStorageClient(
-    bucket_name=minio_config.images_bucket_name,
-    max_file_size=minio_config.images_max_file_size,
-    allowed_mime_types=minio_config.images_allowed_mime_types,
-    expiration_days=minio_config.images_expiration_days
-)
\ No newline at end of file
@@ -1,13 +1,98 @@
 # app/utils.py
+from typing import Any, AsyncIterator, Callable, Iterable, TypeVar
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import os
+import logging
+import mimetypes
+import multiprocessing
+import threading
+import time
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import aioboto3
+from aiobotocore.config import AioConfig
 from .config import minio_config
+from .lowlevel import open_http_session, close_http_session, CONNECT_TIMEOUT, READ_TIMEOUT, MAX_ATTEMPTS
+
+
+logger = logging.getLogger(__name__)
+
+# Load the MIME type database at import time. `mimetypes` otherwise reads the system's mime.types
+# files lazily, under a lock, on the first lookup, which would add that delay to the first upload.
+# Re-initializing an already loaded database would discard types the application registered
+# with `mimetypes.add_type`, so it is only loaded if that has not happened yet.
+if not mimetypes.inited:
+    mimetypes.init()
+
+# Maximum number of keys accepted by a single S3 `DeleteObjects` request.
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Size of the parts of multipart uploads built from streamed data.
+# S3 requires every part except the last one to be at least 5 MiB.
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Maximum number of parts of a single S3 multipart upload.
+MULTIPART_MAX_PARTS = 10000
+
+# Minimum number of keys in a bulk metadata lookup before per-key HEAD requests
+# are coalesced into prefix-scoped LIST requests. Below it, plain HEAD requests are cheaper.
+METADATA_LIST_THRESHOLD = 50
+
+# Upper bound, in seconds, on how long a generated presigned URL is reused.
+PRESIGNED_URL_CACHE_TTL = 60
+
+# Object attributes returned by bulk metadata lookups.
+# These are the attributes available from both `ListObjectsV2` and `HeadObject`.
+OBJECT_SUMMARY_FIELDS = ('Key', 'Size', 'ETag', 'LastModified')
+
+
+# Default settings of managed transfers (sync uploads and downloads, async uploads).
+# Compared to boto3's defaults (8 MiB parts, 10 threads, 256 KiB I/O chunks), larger parts and
+# more threads keep more HTTP streams busy on large files, and larger I/O chunks cut the number of
+# reads and writes per byte. Files up to `multipart_threshold` are still sent in a single request.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=minio_config.multipart_threshold,
+    multipart_chunksize=50 * 1024 * 1024,
+    max_concurrency=16,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+
+# Shared botocore client configuration.
+# The shared client serves every thread, so its urllib3 pool is sized from `minio_config`
+# instead of botocore's default of 10 connections, which would log "Connection pool is full"
+# and discard connections under concurrency. Timeouts are tightened from botocore's 60 seconds,
+# and path-style addressing (`endpoint/bucket/key`) is requested explicitly, as MinIO expects,
+# so bucket names never have to resolve as DNS subdomains.
+_client_config = Config(
+    max_pool_connections=minio_config.max_pool_connections,
+    tcp_keepalive=minio_config.tcp_keepalive,
+    connect_timeout=2,
+    read_timeout=30,
+    retries={"max_attempts": 3, "mode": "standard"},
+    s3={"addressing_style": "path"},
+)
+
+T = TypeVar("T")
+
+
+# Shared boto3 session, which caches the loaded service models and endpoint rules.
+# Clients built from it skip re-reading them from disk. The session holds no connections.
+_session = boto3.session.Session()
+
+# Shared synchronous client, created on first use by `get_client()`.
+_client = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> boto3.client:
     """
-    Create and return a new S3-compatible boto3 client.
+    Return the shared S3-compatible boto3 client, creating it on first use.
 
     Unlike database connections that maintain stateful sessions, transactions, and connection pools
     requiring explicit lifecycle management (connect -> use -> close), boto3 S3 clients are:
@@ -16,9 +101,12 @@ def get_client() -> boto3.client:
         - Thread-safe: Safe for concurrent use without locks.
         - Lightweight: No cleanup required, Python's garbage collector handles resource release.
 
-    Therefore, context managers (with/yield) are unnecessary overhead. We simply create a client
-    on-demand for each operation, and Python automatically releases resources when the client
-    goes out of scope.
+    Therefore, context managers (with/yield) are unnecessary overhead. Constructing a client, however,
+    is expensive (loading service models, resolving the endpoint, creating a connection pool), so a
+    single client is created once and reused by every operation, which also lets its connections be
+    reused between requests.
+
+    Construction itself is not thread-safe (boto3 sessions are not), so it is guarded by a lock.
 
     Returns
     -------
@@ -30,22 +118,84 @@ def get_client() -> boto3.client:
     boto3 clients are dynamically created, so static type checkers may not recognize
     their methods. This is expected and safe to ignore.
     """
-    
-    return boto3.client(
-        service_name="s3",
-        endpoint_url=minio_config.connection_url,
-        aws_access_key_id=minio_config.root_username,
-        aws_secret_access_key=minio_config.root_password,
-        region_name="us-east-1", # Required by S3 API, MinIO ignores it
-        use_ssl=False,
-        verify=False,
+
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # `use_ssl` and `verify` are omitted: the scheme of `endpoint_url` alone decides
+                # whether TLS is used, and botocore only consults `verify` for HTTPS connections.
+                _client = _session.client(
+                    service_name="s3",
+                    endpoint_url=minio_config.connection_url,
+                    aws_access_key_id=minio_config.root_username,
+                    aws_secret_access_key=minio_config.root_password,
+                    region_name="us-east-1", # Required by S3 API, MinIO ignores it
+                    config=_client_config,
+                )
+    return _client
+
+
+def upload_file_part(
+    bucket_name: str,
+    storage_key: str,
+    upload_id: str,
+    part_number: int,
+    file_path: str,
+    offset: int,
+    length: int,
+) -> dict[str, Any]:
+    """
+    Read one byte range of a local file and upload it as a part of a multipart upload.
+
+    Meant to run in a worker process: the worker reads its range from the file itself, so no part
+    data is copied between processes, and uploads it with its own client from `get_client()`.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the bucket.
+    storage_key : str
+        Key of the object being uploaded.
+    upload_id : str
+        ID of the multipart upload.
+    part_number : int
+        1-based number of the part.
+    file_path : str
+        Path to the local file.
+    offset : int
+        Offset of the part in the file, in bytes.
+    length : int
+        Size of the part in bytes.
+
+    Returns
+    -------
+    dict[str, Any]
+        The part entry (PartNumber, ETag) for `CompleteMultipartUpload`.
+    """
+
+    with open(file_path, 'rb') as file:
+        file.seek(offset)
+        data = file.read(length)
+
+    response = get_client().upload_part(
+        Body=data,
+        Bucket=bucket_name,
+        Key=storage_key,
+        UploadId=upload_id,
+        PartNumber=part_number
     )
+    return {'PartNumber': part_number, 'ETag': response['ETag']}
 
 
 def create_bucket_if_not_exists(bucket_name: str) -> None:
     """
     Create the bucket if it doesn't already exist.
 
+    Existence is checked with a `HeadBucket` request first, so the common case of an existing
+    bucket costs one cheap round trip instead of a rejected `CreateBucket` request.
+
     Parameters
     ----------
     bucket_name : str
@@ -54,20 +204,30 @@ def create_bucket_if_not_exists(bucket_name: str) -> None:
     Raises
     ------
     ClientError
-        If bucket creation fails due to permissions, invalid name, or other errors
-        (excluding BucketAlreadyExists and BucketAlreadyOwnedByYou).
+        If the existence check or bucket creation fails due to permissions, invalid name,
+        or other errors (excluding BucketAlreadyExists and BucketAlreadyOwnedByYou).
     """
     
+    client = get_client()
+
+    # The bucket exists on every start but the first, so check for it with a cheap HEAD request
+    try:
+        client.head_bucket(Bucket=bucket_name)
+        logger.info("Bucket '%s' already exists.", bucket_name)
+        return
+    except ClientError as e:
+        if not is_not_found_error(e):
+            raise
+
     try:
-        client = get_client()
         client.create_bucket(Bucket=bucket_name)
-        print(f"Bucket '{bucket_name}' created successfully.")
+        logger.info("Bucket '%s' created successfully.", bucket_name)
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code')
         if error_code in ('BucketAlreadyOwnedByYou', 'BucketAlreadyExists'):
-            print(f"Bucket '{bucket_name}' already exists.")
+            logger.info("Bucket '%s' already exists.", bucket_name)
         else:
-            print(f"Failed to create bucket '{bucket_name}': {e}")
+            logger.error("Failed to create bucket '%s': %s", bucket_name, e)
             raise
 
 
@@ -93,25 +253,453 @@ def setup_lifecycle(bucket_name: str, expiration_days: int) -> None:
     client.put_bucket_lifecycle_configuration(
         Bucket=bucket_name,
         LifecycleConfiguration={
-            'Rules': [
-                {
-                    'ID': f'auto-delete-after-{expiration_days}-days',
-                    'Status': 'Enabled',
-                    'Expiration': {
-                        'Days': expiration_days
-                    },
-                    'Filter': {
-                        'Prefix': ''
-                    }
-                }
-            ]
+            'Rules': [_expiration_rule(expiration_days)]
+        }
+    )
+
+
+def _expiration_rule(expiration_days: int) -> dict[str, Any]:
+    """
+    Build the lifecycle rule that expires every object of a bucket after the given number of days.
+
+    Parameters
+    ----------
+    expiration_days : int
+        The number of days after which objects expire.
+
+    Returns
+    -------
+    dict[str, Any]
+        The rule, as accepted by `PutBucketLifecycleConfiguration`.
+    """
+
+    return {
+        'ID': f'auto-delete-after-{expiration_days}-days',
+        'Status': 'Enabled',
+        'Expiration': {
+            'Days': expiration_days
+        },
+        'Filter': {
+            'Prefix': ''
         }
+    }
+
+
+def _has_expiration_rule(bucket_name: str, expiration_days: int) -> bool:
+    """
+    Check whether the bucket's lifecycle configuration consists of exactly the expected expiration rule.
+
+    Rules are compared on their ID, status and expiration, as servers may normalize other fields
+    (e.g., an empty filter) in their responses.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the bucket.
+    expiration_days : int
+        The expected number of days after which objects expire.
+
+    Returns
+    -------
+    bool
+        True if the configuration is already in place.
+
+    Raises
+    ------
+    ClientError
+        If reading the lifecycle configuration fails for reasons other than it not being set.
+    """
+
+    try:
+        rules = get_client().get_bucket_lifecycle_configuration(Bucket=bucket_name)['Rules']
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'NoSuchLifecycleConfiguration':
+            return False
+        raise
+
+    expected = _expiration_rule(expiration_days)
+    return len(rules) == 1 and all(
+        rules[0].get(field) == expected[field] for field in ('ID', 'Status', 'Expiration')
+    )
+
+
+def setup_bucket(bucket_name: str, expiration_days: int | None = None) -> None:
+    """
+    Make sure the bucket exists and, if requested, expires its objects after the given number of days.
+
+    Combines `create_bucket_if_not_exists` and `setup_lifecycle` on the shared client. The lifecycle
+    configuration is only written if it differs from the current one, so restarting with unchanged
+    settings costs two read requests and no writes.
+
+    Skipped while a spawned worker process (e.g., of `ObjectStorageClient.upload_large`) re-imports
+    the parent's main module: the parent has already set the bucket up, and repeating it would cost
+    every worker the same round trips.
+
+    Parameters
+    ----------
+    bucket_name : str
+        The name of the bucket.
+    expiration_days : int | None, optional
+        Number of days after which objects in the bucket are automatically deleted.
+        If None, the lifecycle configuration is left untouched. Default is None.
+
+    Raises
+    ------
+    ClientError
+        If checking, creating or configuring the bucket fails.
+    """
+
+    # Set by `multiprocessing` in a spawned child until its bootstrap finishes
+    if getattr(multiprocessing.current_process(), '_inheriting', False):
+        return
+
+    create_bucket_if_not_exists(bucket_name=bucket_name)
+
+    if expiration_days is not None and not _has_expiration_rule(bucket_name, expiration_days):
+        setup_lifecycle(bucket_name=bucket_name, expiration_days=expiration_days)
+
+
+class PresignedURLCache:
+    """
+    Small thread-safe cache of generated presigned URLs with per-entry expiry.
+
+    Pages that repeatedly ask for URLs of the same objects (e.g., thumbnails of a listing) are
+    served from memory instead of re-signing. An entry is reused for a tenth of the URL's validity,
+    capped at `PRESIGNED_URL_CACHE_TTL` seconds, so a cached URL is never handed out close to its
+    own expiry. When full, the oldest entry is evicted.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of cached URLs.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of cached URLs. Default is 4096.
+        """
+
+        self.maxsize = maxsize
+        self._entries: dict[Any, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+
+    def get(self, key: Any) -> str | None:
+        """
+        Return the cached URL for the key, or None if it is missing or expired.
+
+        Parameters
+        ----------
+        key : Any
+            Hashable cache key (e.g., operation, bucket and frozen request).
+
+        Returns
+        -------
+        str | None
+            The cached URL, if still fresh.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+
+    def put(self, key: Any, url: str, expires: int) -> None:
+        """
+        Cache a URL generated with the given validity.
+
+        Parameters
+        ----------
+        key : Any
+            Hashable cache key.
+        url : str
+            The presigned URL.
+        expires : int
+            Validity of the URL in seconds, from which the reuse period is derived.
+        """
+
+        ttl = min(expires / 10, PRESIGNED_URL_CACHE_TTL)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, url)
+
+
+def bootstrap_storage(*factories: Callable[[], T]) -> list[T]:
+    """
+    Construct storage clients concurrently on a temporary thread pool.
+
+    Storage clients set up their bucket synchronously on construction (head, create and lifecycle
+    requests), so building them one after another adds up those round trips. Running each factory
+    in a worker thread overlaps them; the boto3 client they share is thread-safe.
+    A thread pool is used rather than `asyncio.gather` because modules calling this may be imported
+    while an event loop is already running (e.g., in Jupyter), where they cannot start one of their own.
+    The pool is shut down before returning, so no idle threads outlive the bootstrap.
+
+    Parameters
+    ----------
+    *factories : Callable[[], T]
+        Zero-argument callables that build one client each (e.g., `functools.partial` objects).
+
+    Returns
+    -------
+    list[T]
+        The built clients, in the order of `factories`.
+
+    Raises
+    ------
+    Exception
+        The first exception raised by a factory, after all of them have finished.
+    """
+
+    with ThreadPoolExecutor(thread_name_prefix="storage-bootstrap") as executor:
+        futures = [executor.submit(factory) for factory in factories]
+        return [future.result() for future in futures]
+
+
+def plan_metadata_lookup(storage_keys: list[str]) -> tuple[list[str], dict[str, list[str]]]:
+    """
+    Split the keys of a bulk metadata lookup into keys to inspect individually via `HeadObject`
+    and groups of keys to inspect together via one `ListObjectsV2` request each.
+
+    Small lookups are served entirely by HEAD requests. Larger ones are grouped by the first two
+    characters of the key; every group with more than one key is listed once under the longest
+    prefix common to its keys, turning N HEAD round trips into one LIST per group.
+
+    Parameters
+    ----------
+    storage_keys : list[str]
+        Keys of the objects to inspect. Duplicates are ignored.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, list[str]]]
+        Keys to inspect with HEAD requests, and a mapping of list prefix to the keys it covers.
+    """
+
+    keys = list(dict.fromkeys(storage_keys))
+    if len(keys) < METADATA_LIST_THRESHOLD:
+        return keys, {}
+
+    groups = defaultdict(list)
+    for key in keys:
+        groups[key[:2]].append(key)
+
+    head_keys = []
+    list_groups = {}
+    for group in groups.values():
+        if len(group) == 1:
+            head_keys.extend(group)
+        else:
+            list_groups[os.path.commonprefix(group)] = group
+
+    return head_keys, list_groups
+
+
+def build_extension_mime_map(mime_types: Iterable[str] | None) -> dict[str, str]:
+    """
+    Map the file extensions of the given MIME types to their MIME type.
+
+    Looking up an extension in this mapping is much cheaper than `mimetypes.guess_type`, so clients
+    build it once for their allowed MIME types and only fall back to `mimetypes` for other files.
+    An extension is only mapped if `mimetypes.guess_type` itself resolves it to that type without
+    an encoding, so a lookup hit gives exactly the result `guess_type` would. Extensions that
+    `guess_all_extensions` lists for a type but `guess_type` resolves differently (e.g., '.c' for
+    'text/plain', '.exe' for 'application/octet-stream') are left to the fallback.
+
+    Parameters
+    ----------
+    mime_types : Iterable[str] | None
+        MIME types to map (e.g., 'image/jpeg'). None yields an empty mapping.
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of extension including the leading dot (e.g., '.jpg') to MIME type.
+    """
+
+    extension_map = {}
+    for mime_type in mime_types or ():
+        for extension in mimetypes.guess_all_extensions(mime_type):
+            if mimetypes.guess_type("x" + extension) == (mime_type, None):
+                extension_map[extension] = mime_type
+    return extension_map
+
+
+def object_summary(obj: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce a `ListObjectsV2` entry to the attributes shared with `HeadObject` responses.
+
+    Parameters
+    ----------
+    obj : dict[str, Any]
+        An entry of the `Contents` list of a `ListObjectsV2` response.
+
+    Returns
+    -------
+    dict[str, Any]
+        Object summary with Key, Size, ETag and LastModified.
+    """
+
+    return {field: obj[field] for field in OBJECT_SUMMARY_FIELDS}
+
+
+def object_summary_from_head(storage_key: str, response: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a `HeadObject` response to the same shape as `object_summary`.
+
+    Parameters
+    ----------
+    storage_key : str
+        Key of the inspected object (not included in HEAD responses).
+    response : dict[str, Any]
+        Raw `HeadObject` response.
+
+    Returns
+    -------
+    dict[str, Any]
+        Object summary with Key, Size, ETag and LastModified.
+    """
+
+    return {
+        'Key': storage_key,
+        'Size': response['ContentLength'],
+        'ETag': response['ETag'],
+        'LastModified': response['LastModified'],
+    }
+
+
+def is_not_found_error(error: ClientError) -> bool:
+    """
+    Check whether a `ClientError` reports a missing object or bucket.
+
+    Parameters
+    ----------
+    error : ClientError
+        The error raised by an S3 operation.
+
+    Returns
+    -------
+    bool
+        True if the error code denotes that the requested resource does not exist.
+    """
+
+    return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NoSuchBucket', 'NotFound')
+
+
+# Shared aioboto3 session.
+# Creating an `aioboto3.Session` loads botocore's service models, endpoint rules and credential
+# resolver chain, which is far more expensive than the S3 call itself for small objects.
+# The session holds no connections, so a single module-level instance is safe to reuse.
+_async_session = aioboto3.Session()
+
+# Shared aiobotocore client configuration.
+# The default pool of 10 connections would serialize concurrent operations on the shared client,
+# so the pool size is taken from `minio_config` and connections are kept alive between requests.
+_async_client_config = AioConfig(
+    max_pool_connections=minio_config.max_pool_connections,
+    tcp_keepalive=minio_config.tcp_keepalive,
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=READ_TIMEOUT,
+    retries={"max_attempts": MAX_ATTEMPTS, "mode": "adaptive"},
+)
+
+# Shared asynchronous client and the context manager it was entered from.
+# Both are populated by `open_async_client()` and released by `close_async_client()`.
+_async_client_cm = None
+_async_client = None
+
+
+def _build_async_client() -> aioboto3.Session.client:
+    """
+    Build a new (not yet entered) asynchronous S3-compatible client context manager
+    from the shared aioboto3 session.
+
+    Returns
+    -------
+    aioboto3.Session.client
+        An async context manager that yields a fully configured S3-compatible client
+        when entered with `async with`.
+    """
+
+    # `use_ssl` is omitted: the scheme of `endpoint_url` alone decides whether TLS is used.
+    # `verify=False` is kept: besides disabling certificate checks, it stops aiobotocore from building
+    # an SSL context and loading the CA bundle for a plain-HTTP endpoint that never uses them.
+    return _async_session.client(
+        service_name="s3",
+        endpoint_url=minio_config.connection_url,
+        aws_access_key_id=minio_config.root_username,
+        aws_secret_access_key=minio_config.root_password,
+        region_name="us-east-1", # Required by S3 API, MinIO ignores it
+        verify=False,
+        config=_async_client_config,
     )
 
 
-def get_async_client() -> aioboto3.Session.client:
+async def open_async_client() -> None:
+    """
+    Enter the shared asynchronous S3-compatible client.
+
+    Intended to be called once on application startup (e.g., from a FastAPI lifespan handler).
+    After this call every `get_async_client()` block reuses the same client and its aiohttp
+    connection pool instead of paying client construction and TCP connect costs per operation.
+    The shared aiohttp session used by low-level requests (see `lowlevel.py`) is opened as well.
+    Calling it again while the client is open is a no-op.
+
+    Notes
+    -----
+    The client is bound to the event loop it was opened in, so it must be opened and closed
+    from the loop that serves the application.
     """
-    Create and return a new asynchronous S3-compatible aioboto3 client context manager.
+
+    global _async_client_cm, _async_client
+
+    await open_http_session()
+
+    if _async_client is not None:
+        return
+
+    client_cm = _build_async_client()
+    _async_client = await client_cm.__aenter__()
+    _async_client_cm = client_cm
+
+
+async def close_async_client() -> None:
+    """
+    Close the shared asynchronous S3-compatible client opened by `open_async_client()`.
+
+    Intended to be called once on application shutdown. Releases the underlying aiohttp
+    sessions and their sockets. Calling it when no client is open is a no-op.
+    """
+
+    global _async_client_cm, _async_client
+
+    await close_http_session()
+
+    if _async_client_cm is None:
+        return
+
+    client_cm = _async_client_cm
+    _async_client_cm = None
+    _async_client = None
+    await client_cm.__aexit__(None, None, None)
+
+
+@asynccontextmanager
+async def get_async_client() -> AsyncIterator[Any]:
+    """
+    Provide an asynchronous S3-compatible aioboto3 client for the duration of an `async with` block.
 
     Unlike the synchronous boto3 client which is stateless and doesn't require explicit cleanup,
     aioboto3 clients are asynchronous context managers that:
@@ -120,32 +708,29 @@ def get_async_client() -> aioboto3.Session.client:
         - Handle connection pooling: Internal aiohttp ClientSession must be closed to release sockets.
         - Prevent resource leaks: Without proper context management, connections remain open.
 
-    Therefore, this function returns a context manager that MUST be used with `async with`:
+    Therefore, this function MUST be used with `async with`:
         async with get_async_client() as client:
             await client.list_buckets()
 
-    This ensures the underlying aiohttp session is properly initialized on entry and gracefully
-    closed on exit, preventing connection leaks and resource exhaustion.
+    If the shared client has been opened with `open_async_client()`, it is yielded as is and
+    entering the block costs nothing. Otherwise a short-lived client is built from the shared
+    session, entered on entry and gracefully closed on exit, preventing connection leaks
+    and resource exhaustion.
 
-    Returns
-    -------
-    aioboto3.Session.client
-        An async context manager that yields a fully configured S3-compatible client
-        when entered with `async with`.
+    Yields
+    ------
+    aiobotocore.client.AioBaseClient
+        A fully configured S3-compatible client.
 
     Notes
     -----
     aioboto3 clients are dynamically created, so static type checkers may not recognize
     their methods. This is expected and safe to ignore.
     """
-    
-    session = aioboto3.Session()
-    return session.client(
-        service_name="s3",
-        endpoint_url=minio_config.connection_url,
-        aws_access_key_id=minio_config.root_username,
-        aws_secret_access_key=minio_config.root_password,
-        region_name="us-east-1", # Required by S3 API, MinIO ignores it
-        use_ssl=False,
-        verify=False,
-    )
\ No newline at end of file
+
+    if _async_client is not None:
+        yield _async_client
+        return
+
+    async with _build_async_client() as client:
+        yield client
\ No newline at end of file